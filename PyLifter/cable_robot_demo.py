@@ -5,6 +5,7 @@ import math
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pylifter.client import PyLifterClient, MoveCode
 
 # Logging Setup
@@ -15,6 +16,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("cable_robot")
 
+# One long-lived thread for blocking input() instead of borrowing the default pool per prompt
+_input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="robot-input")
+
+async def wait_for_input(prompt):
+    return await asyncio.get_running_loop().run_in_executor(_input_executor, input, prompt)
+
 # ==========================================
 # Simulated Client for Offline Testing
 # ==========================================
@@ -24,10 +31,12 @@ class SimulatedLifterClient:
         self.passkey = passkey
         self._is_connected = False
         self._last_known_position = 0
+        self._has_first_pos = True # Match PyLifterClient (simulated position is always known)
         self._cal_slope = 1.0
         self._cal_intercept = 0.0
         self.current_distance = 0.0
         self.last_error_code = 0 # Match PyLifterClient
+        self._position_changed = asyncio.Event() # Match PyLifterClient: set on every position update
         
     def set_unit_calibration(self, slope, intercept):
         self._cal_slope = slope
@@ -79,6 +88,7 @@ class SimulatedLifterClient:
              
              # Reverse calc distance for display
              self.current_distance = (self._cal_slope * self._last_known_position) + self._cal_intercept
+             self._position_changed.set()
              await asyncio.sleep(0.05)
 
 
@@ -109,6 +119,9 @@ class CableRobot:
             3: (w,   l,   h),   # Back-Right
             4: (0.0, l,   h)    # Back-Left
         }
+        # Loop-invariant geometry for the IK / safety hot paths (called per point by planners/plots)
+        self._anchor_items = tuple(self.anchors.items())
+        self._max_tan = math.tan(math.radians(self.safe_angle_deg))
         
         self.clients = {} # ID -> Client
 
@@ -117,12 +130,19 @@ class CableRobot:
         Calculate required cable lengths for a given point (x, y, z).
         Returns: dict {winch_id: length_cm}
         """
-        lengths = {}
-        for wid, anchor in self.anchors.items():
-            ax, ay, az = anchor
-            dist = math.sqrt((x - ax)**2 + (y - ay)**2 + (z - az)**2)
-            lengths[wid] = dist
-        return lengths
+        hypot = math.hypot
+        return {wid: hypot(x - ax, y - ay, z - az) for wid, (ax, ay, az) in self._anchor_items}
+
+    def inverse_kinematics_batch(self, points):
+        """
+        Vectorized inverse_kinematics for an (N, 3) array of points (requires numpy).
+        Returns: (N, 4) array of cable lengths, columns in anchor order (1:FL, 2:FR, 3:BR, 4:BL).
+        """
+        import numpy as np
+        pts = np.asarray(points, dtype=float)
+        anchors = np.array([anchor for _, anchor in self._anchor_items]) # (4, 3)
+        diffs = pts[:, None, :] - anchors[None, :, :]
+        return np.sqrt((diffs * diffs).sum(axis=-1))
 
     def is_safe(self, x, y, z):
         """
@@ -143,19 +163,39 @@ class CableRobot:
         h_dist = self.height - z
         if h_dist <= 0.1: return False, "Too close to ceiling (Singularity)"
 
-        max_tan = math.tan(math.radians(self.safe_angle_deg))
+        max_tan = self._max_tan
+        hypot = math.hypot
         
-        for wid, anchor in self.anchors.items():
-            ax, ay, az = anchor
+        for wid, (ax, ay, az) in self._anchor_items:
             # Horizontal distance to anchor projected on XY plane
-            horiz_dist = math.sqrt((x - ax)**2 + (y - ay)**2)
-            
-            tan_theta = horiz_dist / h_dist
+            tan_theta = hypot(x - ax, y - ay) / h_dist
             if tan_theta > max_tan:
                 return False, f"Cable {wid} angle too steep ({math.degrees(math.atan(tan_theta)):.1f}° > {self.safe_angle_deg}°)"
 
         return True, "Safe"
 
+    def is_safe_batch(self, points):
+        """
+        Vectorized is_safe for an (N, 3) array of points (requires numpy).
+        Returns: (N,) boolean mask - same rules as is_safe, without the reason strings.
+        """
+        import numpy as np
+        pts = np.asarray(points, dtype=float)
+        x, y, z = pts[:, 0], pts[:, 1], pts[:, 2]
+        
+        # 1. Basic Box Limits
+        mask = (x >= 0) & (x <= self.width) & (y >= 0) & (y <= self.length)
+        mask &= (z >= self.min_floor_margin) & (z <= self.height - self.min_ceiling_margin)
+        
+        # 2. Inverted Pyramid: the furthest anchor gives the steepest cable
+        h_dist = self.height - z
+        mask &= h_dist > 0.1
+        anchors = np.array([anchor[:2] for _, anchor in self._anchor_items]) # (4, 2)
+        horiz = np.hypot(x[:, None] - anchors[None, :, 0], y[:, None] - anchors[None, :, 1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mask &= (horiz.max(axis=1) / h_dist) <= self._max_tan
+        return mask
+
     async def initialize_winches(self, winch_config):
         configured_devices = winch_config.get("devices", [])
         
@@ -235,7 +275,7 @@ class CableRobot:
                 if client._cal_slope == 0: continue
                 
                 target_pos = int((length - client._cal_intercept) / client._cal_slope)
-                current_pos = client._last_known_position if client._last_known_position is not None else 0
+                current_pos = client._last_known_position
                 
                 current_len = client.current_distance
                 
@@ -376,18 +416,11 @@ class CableRobot:
         # We need: H - z >= dist_to_anchor / tan(angle)
         # So: z <= H - dist_to_anchor / tan(angle)
         
-        max_tan = math.tan(math.radians(self.safe_angle_deg))
-        
         # We must satisfy constraint for ALL anchors.
         # The constraint is dominated by the anchor FURTHEST from (x,y).
-        max_horiz_dist = 0.0
-        for wid, anchor in self.anchors.items():
-            ax, ay, az = anchor
-            d = math.sqrt((x - ax)**2 + (y - ay)**2)
-            if d > max_horiz_dist:
-                max_horiz_dist = d
+        max_horiz_dist = max(math.hypot(x - ax, y - ay) for _, (ax, ay, az) in self._anchor_items)
                 
-        min_vertical_dist = max_horiz_dist / max_tan
+        min_vertical_dist = max_horiz_dist / self._max_tan
         
         # Max Z = Height - min_vertical_dist
         max_z = self.height - min_vertical_dist
@@ -397,6 +430,12 @@ class CableRobot:
         
         return min(max_z, ceiling_limit)
 
+    def _abort_all(self, abort_event):
+        abort_event.set()
+        # Wake every move monitor now rather than at its next position report
+        for c in self.clients.values():
+            c._position_changed.set()
+
     async def _monitor_single_move(self, client, wid, target_pos, direction, speed, abort_event):
         # Trigger simulation movement if applicable
         if self.sim_mode:
@@ -410,6 +449,9 @@ class CableRobot:
         
         try:
             while True:
+                # Clear before reading state so a report landing mid-check still wakes the wait below
+                client._position_changed.clear()
+                
                 # 1. Global Abort Check
                 if abort_event.is_set():
                     break
@@ -417,7 +459,7 @@ class CableRobot:
                 # 2. Connection Check
                 if not client._is_connected:
                     print(f"  [STOP] Winch {wid} disconnected! Triggering E-STOP.")
-                    abort_event.set()
+                    self._abort_all(abort_event)
                     break
                 
                 # Check for errors (Sim or Real)
@@ -430,18 +472,22 @@ class CableRobot:
                 
                 if client.last_error_code == 0x86:
                         print(f"  [ERROR] Winch {wid}: Hard Limit / End of Travel (0x86)!")
-                        abort_event.set() # Stop other winches immediately
+                        self._abort_all(abort_event) # Stop other winches immediately
                         return False, "HARD_LIMIT"
                 
+                if not client._has_first_pos: break
                 current_pos = client._last_known_position
-                if current_pos is None: break
                 
                 # Check arrival (Deadband)
                 diff = current_pos - target_pos
                 if abs(diff) < 200:
                     break
                 
-                await asyncio.sleep(0.1)
+                # Wake on the next position report (or an abort); the timeout guards a lost notification
+                try:
+                    await asyncio.wait_for(client._position_changed.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
 
             return True, "OK"
 
@@ -510,7 +556,7 @@ async def main():
     print(f"Home (Center): {robot.width/2}, {robot.length/2}, {robot.height/2}")
     
     while True:
-        cmd_str = await asyncio.get_event_loop().run_in_executor(None, input, "\nRobot> ")
+        cmd_str = await wait_for_input("\nRobot> ")
         parts = cmd_str.strip().upper().split()
         if not parts: continue
         
@@ -621,7 +667,7 @@ async def main():
                         info_strs.append(f"Winch {wid} ({limit_name})")
                         
                     print(f"    [!] Movement to {name} incomplete. Soft Limit on: {', '.join(info_strs)}")
-                    val = await asyncio.get_event_loop().run_in_executor(None, input, "    Soft limit hit? Expand limits? (Y/N): ")
+                    val = await wait_for_input("    Soft limit hit? Expand limits? (Y/N): ")
                     if val.lower() == 'y':
                         print(f"    Expanding Limits on Winches {list(failed_wids.keys())}...")
                         from pylifter.protocol import SmartPointCode
@@ -722,8 +768,8 @@ async def main():
 
     # Cleanup
     print("Disconnecting...")
-    for c in robot.clients.values():
-        await c.disconnect()
+    # Independent peripherals - tear the links down concurrently
+    await asyncio.gather(*(c.disconnect() for c in robot.clients.values()), return_exceptions=True)
 
 if __name__ == "__main__":
     try:
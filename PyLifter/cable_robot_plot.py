@@ -59,24 +59,17 @@ def create_robot_plot(robot, current_pos_xyz=None, title_suffix=""):
     max_dim = max(w, l, h)
     step = max_dim / 40.0 # (~40 steps)
     
-    safe_x = []
-    safe_y = []
-    safe_z = []
-    
-    for x in np.arange(0, w + 1, step):
-        for y in np.arange(0, l + 1, step):
-            for z in np.arange(0, h + 1, step):
-                # Basic bounds check first for speed
-                if not (0 <= x <= w and 0 <= y <= l and robot.min_floor_margin <= z <= (robot.height - robot.min_ceiling_margin)):
-                    continue
-                
-                safe, _ = robot.is_safe(x, y, z)
-                if safe:
-                    safe_x.append(x)
-                    safe_y.append(y)
-                    safe_z.append(z)
+    # Evaluate the whole grid at once instead of calling is_safe per point
+    gx, gy, gz = np.meshgrid(
+        np.arange(0, w + 1, step),
+        np.arange(0, l + 1, step),
+        np.arange(0, h + 1, step),
+        indexing='ij'
+    )
+    grid = np.column_stack((gx.ravel(), gy.ravel(), gz.ravel()))
+    safe_pts = grid[robot.is_safe_batch(grid)]
                     
-    ax.scatter(safe_x, safe_y, safe_z, c='blue', alpha=0.2, s=10, marker='.', label='Safe Zone')
+    ax.scatter(safe_pts[:, 0], safe_pts[:, 1], safe_pts[:, 2], c='blue', alpha=0.2, s=10, marker='.', label='Safe Zone')
     
     # 4. Draw Current Position
     if current_pos_xyz is not None:
@@ -2,6 +2,7 @@
 import asyncio
 import logging
 from pylifter import PyLifterClient, MoveCode
+from pylifter.config import load_config, save_config
 
 # Configure logs to suppress library chatter
 logging.basicConfig(level=logging.WARNING)
@@ -17,7 +18,10 @@ async def move_until_stop(client, direction):
     
     start_pos = client._last_known_position
     last_pos = start_pos
-    stalled_count = 0
+    # Bind the loop clock and sleep once for the 50ms poll
+    now = asyncio.get_running_loop().time
+    sleep = asyncio.sleep
+    stable_since = now()
     
     try:
         while True:
@@ -29,24 +33,21 @@ async def move_until_stop(client, direction):
             # Watchdog for stalling (in case flag is missed)
             current_pos = client._last_known_position
             if current_pos == last_pos:
-                stalled_count += 1
-                if stalled_count > 60: # 3 seconds no movement?
+                # Timed, not counted: late wakeups would otherwise stretch the 3 seconds
+                if now() - stable_since > 3.0:
                     print(" -> Stalled (No position change). Stopping.")
                     break
             else:
-                stalled_count = 0
+                stable_since = now()
                 last_pos = current_pos
                 
-            await asyncio.sleep(0.05)
+            await sleep(0.05)
             
     finally:
         await client.stop()
         await asyncio.sleep(1.0) # Settle
 
-import os
-
 async def main():
-    import json
     import os
     
     # Resolve config path relative to this script
@@ -55,8 +56,7 @@ async def main():
     
     # Load Config
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
+        config = load_config(config_file)
     except FileNotFoundError:
         print(f"Error: Configuration file not found at {config_file}")
         print("Please run winch_demo_interactive.py first to pair a device.")
@@ -186,8 +186,7 @@ async def main():
         config["calibration"]["slope"] = slope
         config["calibration"]["intercept"] = intercept
         
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=4)
+        save_config(config_file, config)
         print(f"\n[Saved] Calibration data saved to {config_file}")
         
     except Exception as e:
@@ -197,4 +196,3 @@ async def main():
 
 if __name__ == "__main__":
     asyncio.run(main())
-```
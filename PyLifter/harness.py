@@ -7,14 +7,19 @@ import sys
 from bleak import BleakScanner, BleakClient
 from pylifter.protocol import *
 
+# uvloop when installed (timers/IO dispatched by libuv in C); stock asyncio loop otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Zero-payload request packets never change - build them once
+GET_PASSKEY_PACKET = build_packet(CommandCode.GET_PASSKEY)
+GET_STATS_PACKET = build_packet(CommandCode.GET_STATS)
+
 # Global cleanup for manual tshark handling
 tshark_proc = None
 
-# Event to signal auth completion
-auth_event = asyncio.Event()
-# Event for command completion
-cmd_event = asyncio.Event()
-
 async def scan():
     print("Scanning for MyLifter devices...")
     devices = await BleakScanner.discover(service_uuids=[MYLIFTER_SERVICE_UUID])
@@ -30,6 +35,12 @@ async def scan():
 async def run_harness(mac_address, command, speed, distance, capture_file):
     global tshark_proc
     
+    # Python 3.12+: tasks (e.g. authenticate() spawned from the notify handler) run to their
+    # first real suspension immediately instead of waiting a loop pass to be scheduled
+    eager = getattr(asyncio, "eager_task_factory", None)
+    if eager is not None:
+        asyncio.get_running_loop().set_task_factory(eager)
+    
     if capture_file:
         print(f"Starting tshark capture to {capture_file}...")
         # Start tshark in background
@@ -41,68 +52,80 @@ async def run_harness(mac_address, command, speed, distance, capture_file):
             print(f"Failed to start tshark: {e}")
             tshark_proc = None
 
+    # One-shot results from the notify handler, created on the running loop:
+    # auth completion (SET_PASSKEY ACK) and the GET_STATS reply
+    loop = asyncio.get_running_loop()
+    auth_future = loop.create_future()
+    stats_future = loop.create_future()
+
     print(f"Connecting to {mac_address}...")
     async with BleakClient(mac_address) as client:
         print("Connected.")
         
         # Subscribe to notifications
+        # Per-command handlers, looked up by the first byte of each notification
+        def on_passkey(data):
+            # Payload begins at index 2 (Cmd, Len, Payload...)
+            # GET_PASSKEY and SET_PASSKEY share code 3; the device only ever sends the
+            # GET_PASSKEY form (providing the key) - it answers our SET_PASSKEY with an ACK.
+            if len(data) >= 8: # 1+1+6
+                passkey = data[2:8]
+                print(f"Received Passkey: {passkey.hex()}")
+                # Send Set Passkey
+                asyncio.create_task(authenticate(client, passkey))
+
+        def on_ack(data):
+            # Payload is the command code being Acked
+            if len(data) >= 3:
+                 acked_cmd = data[2]
+                 print(f"ACK Received for Cmd: {acked_cmd:#04x}")
+                 if acked_cmd == CommandCode.SET_PASSKEY:
+                     print("Authentication confirmed (ACK received).")
+                     if not auth_future.done():
+                         auth_future.set_result(True)
+
+        def on_move(data):
+            payload = data[2:]
+            try:
+                parsed = parse_move_response(payload)
+                print(f"Move Status: {parsed}")
+            except Exception as e:
+                print(f"Error parsing move response: {e}")
+
+        def on_stats(data):
+            print(f"Stats Received: {data.hex()}")
+            if not stats_future.done():
+                stats_future.set_result(bytes(data))
+
+        def on_version(data):
+            print(f"Version Received: {data.hex()}")
+
+        handlers = {
+            CommandCode.GET_PASSKEY: on_passkey,
+            CommandCode.ACK: on_ack,
+            CommandCode.MOVE: on_move,
+            CommandCode.GET_STATS: on_stats,
+            CommandCode.GET_VERSION: on_version,
+        }
+
         def notification_handler(sender, data):
             print(f"RX: {data.hex()}")
             
             # Simple parser based on first byte
-            cmd = data[0] if len(data) > 0 else None
-            
-            if cmd == CommandCode.GET_PASSKEY:
-                # Payload begins at index 2 (Cmd, Len, Payload...)
-                if len(data) >= 8: # 1+1+6
-                    passkey = data[2:8]
-                    print(f"Received Passkey: {passkey.hex()}")
-                    # Send Set Passkey
-                    asyncio.create_task(authenticate(client, passkey))
-            
-            elif cmd == CommandCode.ACK:
-                # Payload is the command code being Acked
-                if len(data) >= 3:
-                     acked_cmd = data[2]
-                     print(f"ACK Received for Cmd: {acked_cmd:#04x}")
-                     if acked_cmd == CommandCode.SET_PASSKEY:
-                         print("Authentication confirmed (ACK received).")
-                         auth_event.set()
-
-            elif cmd == CommandCode.SET_PASSKEY:
-                # Should not happen because SET_PASSKEY=0x03 covered by GET_PASSKEY check if logic flawn?
-                # Actually GET_PASSKEY and SET_PASSKEY are same int value (3).
-                # But here we only expect GET_PASSKEY as a notification from device (providing the key).
-                # SET_PASSKEY is what WE send. The device responds with ACK.
-                pass
-
-
-            elif cmd == CommandCode.MOVE:
-                payload = data[2:]
-                try:
-                    parsed = parse_move_response(payload)
-                    print(f"Move Status: {parsed}")
-                except Exception as e:
-                    print(f"Error parsing move response: {e}")
-
-            elif cmd == CommandCode.GET_STATS:
-                print(f"Stats Received: {data.hex()}")
-                cmd_event.set()
-                
-            elif cmd == CommandCode.GET_VERSION:
-                print(f"Version Received: {data.hex()}")
+            handler = handlers.get(data[0]) if data else None
+            if handler is not None:
+                handler(data)
 
         await client.start_notify(RESPONSE_CHAR_UUID, notification_handler)
         print("Subscribed. Starting Authentication Handshake...")
 
         # 1. Send Get Passkey
         print("Sending Get Passkey...")
-        packet = build_packet(CommandCode.GET_PASSKEY)
-        await client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=True)
+        await client.write_gatt_char(COMMAND_CHAR_UUID, GET_PASSKEY_PACKET, response=True)
         
         # Wait for Auth
         try:
-            await asyncio.wait_for(auth_event.wait(), timeout=5.0)
+            await asyncio.wait_for(auth_future, timeout=5.0)
             print("Authenticated!")
         except asyncio.TimeoutError:
             print("Authentication Timed Out! Device might not be responding.")
@@ -116,8 +139,7 @@ async def run_harness(mac_address, command, speed, distance, capture_file):
             # Run for some time then stop
             await asyncio.sleep(2)
             print("Stopping...")
-            stop_packet = build_move_packet(MoveCode.STOP)
-            await client.write_gatt_char(COMMAND_CHAR_UUID, stop_packet, response=True)
+            await client.write_gatt_char(COMMAND_CHAR_UUID, STOP_PACKET, response=True)
 
         elif command == "move_down":
             print(f"Moving DOWN at speed {speed}...")
@@ -125,15 +147,13 @@ async def run_harness(mac_address, command, speed, distance, capture_file):
             await client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=True)
             await asyncio.sleep(2)
             print("Stopping...")
-            stop_packet = build_move_packet(MoveCode.STOP)
-            await client.write_gatt_char(COMMAND_CHAR_UUID, stop_packet, response=True)
+            await client.write_gatt_char(COMMAND_CHAR_UUID, STOP_PACKET, response=True)
         
         elif command == "get_stats":
             print("Getting Stats...")
-            packet = build_packet(CommandCode.GET_STATS)
-            await client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=True)
+            await client.write_gatt_char(COMMAND_CHAR_UUID, GET_STATS_PACKET, response=True)
             try:
-                await asyncio.wait_for(cmd_event.wait(), timeout=3.0)
+                await asyncio.wait_for(stats_future, timeout=3.0)
             except asyncio.TimeoutError:
                 print("Stats timeout")
 
@@ -158,6 +178,8 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # loop = asyncio.get_event_loop() # Deprecated
+    if uvloop is not None:
+        uvloop.install()
     
     if args.mode == "scan":
         asyncio.run(scan())
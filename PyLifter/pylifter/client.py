@@ -2,37 +2,130 @@
 import asyncio
 import logging
 import struct
-from typing import Optional, Callable
+import time
+from collections import deque
+from typing import Optional, Callable, Dict, Deque, Tuple
 from bleak import BleakClient, BleakScanner
+from bleak.exc import BleakDBusError
 from .protocol import *
 
 logger = logging.getLogger(__name__)
 
-TESTED_FIRMWARE_VERSIONS = ["3.2"]
+TESTED_FIRMWARE_VERSIONS = frozenset({"3.2"})
+
+# Precompiled formats for the notification hot path (payload starts after [Cmd][Len])
+_MOVE_STRUCT = struct.Struct("<BBiH")    # Status, Error, Position, Weight
+_STATS_STRUCT = struct.Struct("<HIHHHHI")
+_VERSION_STRUCT = struct.Struct("<BBBBHBB")
+_SINGLE_BYTES = tuple(bytes((i,)) for i in range(256)) # One-byte payloads, indexed by value
+
+# MOVE error code -> (log level, %-format taking Pos); unknown codes fall back to a generic error
+_MOVE_ERRORS = {
+    0x86: (logging.WARNING, "End of Travel Reached (0x86) at Pos=%d"),
+    0x09: (logging.ERROR, "Sync Error (0x09)! DevicePos=%d"),
+    0x81: (logging.WARNING, "Soft Limit Reached (0x81) at Pos=%d"), # WarningSoftLimit
+    0x83: (logging.WARNING, "Enable to Move: Smart Point Not Set (0x83) at Pos=%d"), # ErrorSmartPointNotSet
+}
+
+# Minimum notification length ([Cmd][Len] + payload) per response code
+_EXPECTED_LEN = {
+    CommandCode.GET_PASSKEY: 8,
+    CommandCode.ACK: 3,
+    CommandCode.GET_STATS: 2 + _STATS_STRUCT.size,
+    CommandCode.GET_VERSION: 2 + _VERSION_STRUCT.size,
+    CommandCode.GET_PROTOCOL_VERSION: 3,
+    CommandCode.MOVE: 2 + _MOVE_STRUCT.size,
+}
+
+def _release_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
 
 class PyLifterClient:
-    def __init__(self, mac_address: str, passkey: Optional[str] = None):
+    # Fixed attribute set: slots avoid the per-instance __dict__ on the hot paths
+    __slots__ = (
+        "mac_address", "_passkey", "_client", "_auth_future", "_write_lock",
+        "_notification_callbacks", "_pending", "_handlers",
+        "_polling_task", "_target_move_code", "_target_speed", "_is_connected",
+        "_last_known_position", "_has_first_pos", "_last_known_weight", "_position_changed", "_history",
+        "last_error_code", "_last_logged_error_code",
+        "_cal_slope", "_cal_intercept", "current_distance", "_suppress_disconnect_callbacks",
+        "_tx_buf", "_tx_dirty", "_tick_waiter", "_wake_requested", "_passkey_packet",
+        "_cmd_queue", "_cmd_worker", "_last_sent_packet", "_last_send_t", "_disconnected", "_ble_device",
+        "_command_char",
+    )
+
+    # Zero-payload commands always serialize to the same bytes, so build them once.
+    _STATIC_PACKETS: Dict[int, bytes] = {
+        code: build_packet(code)
+        for code in (
+            CommandCode.GET_PASSKEY,
+            CommandCode.GET_PROTOCOL_VERSION,
+            CommandCode.CLEAR_ERROR,
+            CommandCode.GET_VERSION,
+            CommandCode.GO_OVERRIDE,
+            CommandCode.GET_STATS,
+        )
+    }
+
+    # Single-byte code commands (smart points / calibration) for the common codes 0..8
+    _CODE_PACKETS: Dict[tuple, bytes] = {
+        (cmd, code): build_packet(cmd, _SINGLE_BYTES[code])
+        for cmd in (CommandCode.CALIBRATE, CommandCode.FACTORY_CALIBRATE, CommandCode.CLEAR_CALIBRATION)
+        for code in range(9)
+    }
+
+    def __init__(self, mac_address: str, passkey: Optional[str] = None, history_size: int = 0, device=None):
         self.mac_address = mac_address
+        # BLEDevice from a recent scan, if any: lets bleak connect without re-discovering the address
+        self._ble_device = device
         self._passkey: Optional[bytes] = bytes.fromhex(passkey) if passkey else None
+        self._passkey_packet: Optional[bytes] = None # SET_PASSKEY bytes, reset whenever _passkey changes
         self._client: Optional[BleakClient] = None
-        self._auth_event = asyncio.Event()
+        self._auth_future: Optional[asyncio.Future] = None # Fresh per attempt; a late ACK can't leak into the next one
         self._write_lock = asyncio.Lock() # Serialize GATT writes
         
         self._notification_callbacks = []
-        self._notification_callbacks = []
-        self._stats_future: Optional[asyncio.Future] = None
-        self._version_future: Optional[asyncio.Future] = None
-        self._proto_version_future: Optional[asyncio.Future] = None
+        # Response command code -> bound handler (one dict lookup per notification)
+        self._handlers: Dict[int, Callable] = {
+            CommandCode.GET_PASSKEY: self._on_passkey,
+            CommandCode.ACK: self._on_ack,
+            CommandCode.GET_STATS: self._on_stats,
+            CommandCode.GET_VERSION: self._on_version,
+            CommandCode.GET_PROTOCOL_VERSION: self._on_protocol_version,
+            CommandCode.MOVE: self._on_move,
+        }
+        # In-flight request futures keyed by the response command code
+        self._pending: Dict[int, asyncio.Future] = {}
+        
+        # Follow-up commands queued from the notification handler, drained by one worker task
+        self._cmd_queue: asyncio.Queue = asyncio.Queue()
+        self._cmd_worker: Optional[asyncio.Task] = None
         
         # State for Keep-Alive Loop
         self._polling_task: Optional[asyncio.Task] = None
         self._target_move_code: MoveCode = MoveCode.STOP
         self._target_speed: int = 0
         self._is_connected = False
+        # Keep-alive packet buffer, rewritten in place only when target or position changes
+        self._tx_buf = bytearray(MOVE_PACKET_LEN)
+        self._tx_dirty = True
+        # Keep-alive tick: a future released by a loop.call_at timer, or early by move()/override_move()
+        self._tick_waiter: Optional[asyncio.Future] = None
+        self._wake_requested = False
+        # Last out-of-band write (stop()), so the keep-alive can drop an identical packet right behind it
+        self._last_sent_packet: bytes = b""
+        self._last_send_t: float = 0.0
         
         # Internal state
-        # Initialize to None to indicate we haven't synced with device yet
-        self._last_known_position: Optional[int] = None 
+        # Position stays a plain int for the hot paths; _has_first_pos records whether
+        # the device has reported it yet
+        self._last_known_position: int = 0
+        self._has_first_pos: bool = False
+        # Set on every MOVE notification so monitors can wait for fresh state instead of polling
+        self._position_changed = asyncio.Event()
+        # Optional telemetry ring of (monotonic time, position, weight, error code); off by default
+        self._history: Optional[Deque[Tuple[float, int, int, int]]] = deque(maxlen=history_size) if history_size > 0 else None
         self._last_known_weight: int = 0
         self.last_error_code: int = 0 
         self._last_logged_error_code: int = -1 # For suppressing duplicate logs 
@@ -40,30 +133,36 @@ class PyLifterClient:
         # Calibration state (Linear: Distance = Slope * Position + Intercept)
         self._cal_slope: float = 0.0
         self._cal_intercept: float = 0.0 
+        # Estimated distance in configured units; recomputed on position/calibration change
+        # so readers get a plain attribute (0.0 until the first position sync)
+        self.current_distance: float = 0.0
         # Connect management
-        self._is_connected = False
         self._suppress_disconnect_callbacks = False
+        # Set by bleak's disconnect callback once the link is really down; cleared on connect
+        self._disconnected = asyncio.Event()
+        # Command characteristic resolved once per connection (bleak accepts the UUID until then)
+        self._command_char = COMMAND_CHAR_UUID
 
     @property
     def passkey(self) -> Optional[bytes]:
         return self._passkey 
         
+    @property
+    def position_history(self) -> Optional[Deque[Tuple[float, int, int, int]]]:
+        """Last `history_size` MOVE samples as (monotonic time, position, weight, error code), or None if disabled."""
+        return self._history
+
     @property
     def current_weight(self) -> int:
         """Returns the last reported weight load (raw unit)."""
         return self._last_known_weight
 
-    @property
-    def current_distance(self) -> float:
-        """Returns the estimated distance in configured units based on calibration."""
-        if self._last_known_position is None:
-            return 0.0
-        return (self._cal_slope * self._last_known_position) + self._cal_intercept
-
     def set_unit_calibration(self, slope: float, intercept: float):
         """Sets the linear calibration factors (y = mx + b)."""
         self._cal_slope = slope
         self._cal_intercept = intercept
+        if self._has_first_pos:
+            self.current_distance = (slope * self._last_known_position) + intercept
         logger.info(f"Calibration Set: Dist = {slope:.5f} * Pos + {intercept:.2f}")
 
     def _on_disconnect(self, client: BleakClient):
@@ -75,6 +174,16 @@ class PyLifterClient:
         if not self._suppress_disconnect_callbacks:
             logger.info(f"Bleak Disconnected Callback for {self.mac_address}")
             self._is_connected = False
+            self._disconnected.set()
+            # Wake anything waiting on a MOVE report so it sees the disconnect now
+            self._position_changed.set()
+
+    def _make_client(self) -> BleakClient:
+        return BleakClient(
+            self._ble_device or self.mac_address, 
+            disconnected_callback=self._on_disconnect,
+            timeout=20.0
+        )
 
     async def _establish_connection(self):
         """Internal helper to create connection, auth, and setup notifications."""
@@ -88,17 +197,25 @@ class PyLifterClient:
         await asyncio.sleep(1.0) 
             
         logger.info(f"Initiating connection to {self.mac_address} (Timeout=20s)...")
+        self._command_char = COMMAND_CHAR_UUID # Handles from the old link are stale
         # Initialize with callback, but suppress it initially
         self._suppress_disconnect_callbacks = True
-        self._client = BleakClient(
-            self.mac_address, 
-            disconnected_callback=self._on_disconnect,
-            timeout=20.0
-        ) 
+        # Reuse the existing instance on retry; bleak can re-connect it after a disconnect
+        if self._client is None:
+            self._client = self._make_client()
         
         try:
             # 3. Connect (Bleak handles Service Discovery internally)
-            await self._client.connect()
+            try:
+                await self._client.connect()
+            except BleakDBusError as e:
+                # BlueZ dropped the device object behind this instance - only now build a fresh one
+                if e.dbus_error != "org.freedesktop.DBus.Error.UnknownObject":
+                    raise
+                logger.info("Stale BlueZ device object. Recreating client...")
+                self._ble_device = None # The scanned device object is what went stale
+                self._client = self._make_client()
+                await self._client.connect()
             # Connection successful - enable callback
             self._suppress_disconnect_callbacks = False
             
@@ -124,11 +241,7 @@ class PyLifterClient:
             # # 3b. Retry Connection
             # logger.info("Retrying connection after scrub...")
             # self._suppress_disconnect_callbacks = True
-            # self._client = BleakClient(
-            #     self.mac_address, 
-            #     disconnected_callback=self._on_disconnect,
-            #     timeout=20.0
-            # ) 
+            # self._client = self._make_client()
             # await self._client.connect()
             # self._suppress_disconnect_callbacks = False
             
@@ -142,8 +255,11 @@ class PyLifterClient:
             raise e
 
         self._is_connected = True 
+        self._disconnected.clear()
         
         await self._client.start_notify(RESPONSE_CHAR_UUID, self._notification_handler)
+        # Every write would otherwise map the UUID string to its characteristic again
+        self._command_char = self._client.services.get_characteristic(COMMAND_CHAR_UUID) or COMMAND_CHAR_UUID
         
         # 4. Authenticate & Start Keep-Alive IMMEDIATELY
         await self._authenticate()
@@ -151,6 +267,10 @@ class PyLifterClient:
     async def connect(self, wait_for_position: bool = True):
         logger.info(f"Connecting to {self.mac_address}...")
         
+        # Worker must be up before auth: the pairing handshake replies through it
+        if self._cmd_worker is None:
+            self._cmd_worker = asyncio.create_task(self._command_worker())
+        
         # Use helper with parameters
         await self._establish_connection()
         logger.info("Connected & Authenticated. Starting Keep-Alive...")
@@ -160,25 +280,55 @@ class PyLifterClient:
         
         if wait_for_position:
             # 2. Wait for initial position sync
-            logger.info("Waiting for initial position sync...")
-            for _ in range(20): # Wait up to 2 seconds
-                if self._last_known_position is not None:
-                    logger.info(f"Initial position synced: {self._last_known_position}")
-                    break
-                await asyncio.sleep(0.1)
-                
-            if self._last_known_position is None:
-                logger.warning("Initial position not received. Defaulting to 0 (Risky - May cause Sync Error).")
-                self._last_known_position = 0
+            await self._wait_for_position_sync()
         else:
             logger.info("Skipping initial position sync (Pairing Mode).")
-            # Initialize to 0 strictly to avoid type errors if accessed, 
-            # though we shouldn't use this client for moves.
-            if self._last_known_position is None:
-                self._last_known_position = 0
         
         logger.info("Authenticated and Ready.")
 
+    async def _wait_for_position_sync(self):
+        logger.info("Waiting for initial position sync...")
+        # Wake on the first MOVE report instead of polling every 100ms (up to 2 seconds)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2.0
+        while True:
+            # Clear before checking so a report landing in between still wakes the wait
+            self._position_changed.clear()
+            if self._has_first_pos:
+                logger.info(f"Initial position synced: {self._last_known_position}")
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._position_changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            
+        if not self._has_first_pos:
+            logger.warning("Initial position not received. Defaulting to 0 (Risky - May cause Sync Error).")
+
+    async def finalize_pairing(self, passkey: Optional[bytes] = None):
+        """
+        Completes a `connect(wait_for_position=False)` pairing on the same link:
+        authenticates with the received passkey, starts the keep-alive and syncs position.
+        Saves the disconnect + second connect a fresh client would need.
+        """
+        if passkey is not None and passkey != self._passkey:
+            self._passkey = passkey
+            self._passkey_packet = None
+        if not self._passkey:
+            raise RuntimeError("No passkey to finalize pairing with.")
+        if not self._is_connected:
+            raise RuntimeError("Not connected.")
+        # SET_PASSKEY was already ACKed during the pairing handshake - only redo it if not
+        if self._auth_future is None or not self._auth_future.done():
+            await self._authenticate()
+        elif self._polling_task is None:
+            logger.info("Starting Keep-Alive Loop (Post-Pairing)...")
+            self._polling_task = asyncio.create_task(self._keep_alive_loop())
+        await self._wait_for_position_sync()
+
     async def disconnect(self):
         self._is_connected = False
         
@@ -190,6 +340,14 @@ class PyLifterClient:
                 pass
             self._polling_task = None
             
+        if self._cmd_worker:
+            self._cmd_worker.cancel()
+            try:
+                await self._cmd_worker
+            except asyncio.CancelledError:
+                pass
+            self._cmd_worker = None
+            
         if self._client:
              try:
                  await self._client.stop_notify(RESPONSE_CHAR_UUID)
@@ -199,45 +357,102 @@ class PyLifterClient:
              self._client = None
              logger.info("Disconnected.")
 
+    async def wait_disconnected(self, timeout: float = 2.0) -> bool:
+        """Waits until the adapter reports the link down (bleak's disconnect callback). False on timeout."""
+        try:
+            await asyncio.wait_for(self._disconnected.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _command_worker(self):
+        """Runs the (bound coroutine function, arg) pairs queued by _notification_handler, one at a time."""
+        while True:
+            fn, arg = await self._cmd_queue.get()
+            try:
+                await fn(arg)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Queued command '{fn.__name__}' failed: {e}")
+
+    async def _log_move_error(self, arg):
+        error_code, pos = arg
+        entry = _MOVE_ERRORS.get(error_code)
+        if entry is not None:
+            logger.log(entry[0], entry[1], pos)
+        else:
+            logger.error("MOVE returned Error Code: %d at Pos=%d", error_code, pos)
+
+    def _wake_keep_alive(self):
+        """Sends the next keep-alive now instead of at its scheduled tick."""
+        self._wake_requested = True
+        waiter = self._tick_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
     async def _keep_alive_loop(self):
         logger.info("Keep-Alive Loop Started.")
         try:
             service_fail_count = 0
+            # Deadline-based ticks: sleep until the next slot instead of a fixed interval
+            # so write/log time doesn't accumulate as drift
+            loop = asyncio.get_running_loop()
+            next_t = loop.time()
+            # Bind per-tick lookups once; `write` is re-bound whenever reconnect swaps the client
+            client = self._client
+            write = client.write_gatt_char if client is not None else None
+            lock = self._write_lock
+            sleep = asyncio.sleep
+            tx_buf = self._tx_buf
+            build_move = build_move_packet_into
+            build_override = build_override_packet_into
             while self._is_connected:
-                # Build packet based on current state
                 # ALWAYS use _last_known_position to prevent Sync Errors
-                pos = self._last_known_position if self._last_known_position is not None else 0
-                
-                # Safety check: if we are trying to move but pos is None (unlikely due to connect wait), we might trigger error.
+                pos = self._last_known_position
                 
-                # Checks if we need to use GO_OVERRIDE (0x25) or MOVE (0x23)
-                if self._target_move_code in [MoveCode.OVERRIDE_UP, MoveCode.OVERRIDE_DOWN]:
-                    # Map OVERRIDE_UP -> UP (1), OVERRIDE_DOWN -> DOWN (2) for the inner payload
-                    # (Assuming GO_OVERRIDE implies the override nature)
-                    inner_code = MoveCode.UP if self._target_move_code == MoveCode.OVERRIDE_UP else MoveCode.DOWN
-                    
-                    packet = build_override_packet(
-                        inner_code,
-                        speed=self._target_speed,
-                        avg_pos=pos
-                    )
-                else:
-                    packet = build_move_packet(
-                        self._target_move_code, 
-                        speed=self._target_speed,
-                        avg_pos=pos
-                    )
+                # Rebuild packet only when move()/stop() or a position update marked it dirty
+                if self._tx_dirty:
+                    self._tx_dirty = False
+                    move_code = self._target_move_code
+                    # Checks if we need to use GO_OVERRIDE (0x25) or MOVE (0x23)
+                    if move_code in [MoveCode.OVERRIDE_UP, MoveCode.OVERRIDE_DOWN]:
+                        # Map OVERRIDE_UP -> UP (1), OVERRIDE_DOWN -> DOWN (2) for the inner payload
+                        # (Assuming GO_OVERRIDE implies the override nature)
+                        inner_code = MoveCode.UP if move_code == MoveCode.OVERRIDE_UP else MoveCode.DOWN
+                        
+                        build_override(
+                            tx_buf,
+                            inner_code,
+                            speed=self._target_speed,
+                            avg_pos=pos
+                        )
+                    else:
+                        build_move(
+                            tx_buf,
+                            move_code, 
+                            speed=self._target_speed,
+                            avg_pos=pos
+                        )
+                packet = tx_buf
                 
-                if self._client and self._client.is_connected:
+                if self._is_connected and self._client is not None:
+                    if self._client is not client:
+                        client = self._client
+                        write = client.write_gatt_char
                     try:
-                        logger.debug(f"TX PKT: Move={self._target_move_code}, Speed={self._target_speed}, Pos={pos}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("TX PKT: Move=%s, Speed=%d, Pos=%d", self._target_move_code, self._target_speed, pos)
                         
+                        # stop() just wrote these exact bytes: skip the duplicate; the next tick is the heartbeat
+                        if loop.time() - self._last_send_t < 0.1 and packet == self._last_sent_packet:
+                            pass
                         # Only send if lock is available (don't block keep-alive on long ops)
-                        if not self._write_lock.locked():
-                            async with self._write_lock:
-                                await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
-                                # Throttle: Give the stack a moment to breathe
-                                await asyncio.sleep(0.02)
+                        elif not lock.locked():
+                            # No throttle inside the lock here: the tick sleep below already paces
+                            # keep-alives, and holding the lock would delay stop()/override writes
+                            async with lock:
+                                await write(self._command_char, packet, response=False)
                                 
                             service_fail_count = 0 # Reset on successful write
                             
@@ -260,35 +475,60 @@ class PyLifterClient:
                                     continue # Resume loop immediately
                                 except Exception as rec_err:
                                     logger.error(f"Reconnection Attempt Failed: {rec_err}")
-                                    await asyncio.sleep(1.0)
+                                    await sleep(1.0)
                                     continue
                         else:
                             # For other errors, just warn
                              logger.warning(f"Keep-Alive Write Failed: {e}")
                 
                 if self._target_move_code != MoveCode.STOP:
-                    await asyncio.sleep(0.2) # 5Hz when moving (Responsive)
+                    next_t += 0.2 # 5Hz when moving (Responsive)
+                else:
+                    next_t += 0.25 # 4Hz when idle (Stable, Standard)
+                if next_t > loop.time():
+                    # Wait for the deadline on a timer handle; a new move request releases it early
+                    if not self._wake_requested:
+                        waiter = loop.create_future()
+                        self._tick_waiter = waiter
+                        handle = loop.call_at(next_t, _release_waiter, waiter)
+                        try:
+                            await waiter
+                        finally:
+                            handle.cancel()
+                            self._tick_waiter = None
+                    if self._wake_requested:
+                        self._wake_requested = False
+                        next_t = loop.time()
                 else:
-                    await asyncio.sleep(0.25) # 4Hz when idle (Stable, Standard)
+                    # Fell behind (long write / reconnect): resync rather than bursting
+                    next_t = loop.time()
+                    await sleep(0)
                     
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.error(f"Keep-Alive Loop Error: {e}")
 
+    def _code_packet(self, cmd: int, code: int) -> bytes:
+        """Returns the cached [cmd][1][code] packet, building it for uncommon codes."""
+        packet = self._CODE_PACKETS.get((cmd, code))
+        if packet is None:
+            packet = build_packet(cmd, _SINGLE_BYTES[code])
+        return packet
+
     async def write_command(self, packet: bytes, response: bool = True):
         """Helper to safely write commands with lock and throttling."""
         async with self._write_lock:
-             await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=response)
+             await self._client.write_gatt_char(self._command_char, packet, response=response)
              # Throttle: Give the stack a moment to breathe
              await asyncio.sleep(0.02)
 
     async def _authenticate(self):
-        self._auth_event.clear()
+        self._auth_future = asyncio.get_running_loop().create_future()
         
         if self._passkey:
             logger.info("Sending Passkey...")
-            packet = build_packet(CommandCode.SET_PASSKEY, self._passkey)
+            packet = self._get_passkey_packet()
             # Use the throttled helper if possible, or direct for now since _authenticate uses direct writes
             await self.write_command(packet, response=False)
             
@@ -303,7 +543,7 @@ class PyLifterClient:
              logger.info("No passkey provided. Sending GET_PASSKEY request...")
              
              # Send GET_PASSKEY (0x03, empty payload)
-             packet = build_packet(CommandCode.GET_PASSKEY)
+             packet = self._STATIC_PACKETS[CommandCode.GET_PASSKEY]
              await self.write_command(packet, response=False)
              
              logger.info("Waiting for button press on Winch...")
@@ -314,21 +554,21 @@ class PyLifterClient:
              # We should wait here until we have a passkey, or timeout.
              try:
                  # We need a new event for "Passkey Received" separate from "Auth Complete"?
-                 # Actually, _notification_handler sets _passkey and calls _send_set_passkey, which eventually sets _auth_event.
-                 # So waiting for _auth_event might be enough IF the device sends the passkey.
-                 # But _auth_event is set when SET_PASSKEY is ACKed.
+                 # Actually, _notification_handler sets _passkey and calls _send_set_passkey, which eventually resolves _auth_future.
+                 # So waiting for _auth_future might be enough IF the device sends the passkey.
+                 # But _auth_future is resolved when SET_PASSKEY is ACKed.
                  
                  # Logic check:
                  # 1. User presses button.
                  # 2. Device sends 0x41 (GET_PASSKEY) with payload.
                  # 3. Handler extracts passkey, updates self._passkey.
-                 # 4. Handler spawns _send_set_passkey.
+                 # 4. Handler queues _send_set_passkey for the command worker.
                  # 5. Client sends SET_PASSKEY.
                  # 6. Device sends ACK.
-                 # 7. Handler sets _auth_event.
+                 # 7. Handler resolves _auth_future.
                  
-                 # So yes, we can just wait for _auth_event, but with a longer timeout for user action.
-                 await asyncio.wait_for(self._auth_event.wait(), timeout=30.0) 
+                 # So yes, we can just wait for _auth_future, but with a longer timeout for user action.
+                 await asyncio.wait_for(self._auth_future, timeout=30.0) 
                  logger.info("Pairing Successful (Passkey Received).")
              except asyncio.TimeoutError:
                  logger.error("Pairing Timed Out: Button not pressed?")
@@ -340,6 +580,8 @@ class PyLifterClient:
              
         self._target_move_code = direction
         self._target_speed = speed
+        self._tx_dirty = True
+        self._wake_keep_alive()
         
         # We allow immediate "send" optimization for responsiveness if needed, but the loop is fast enough.
         # Just updating state is safer to avoid race conditions on write_gatt_char.
@@ -348,174 +590,158 @@ class PyLifterClient:
         """Stops the winch."""
         self._target_move_code = MoveCode.STOP
         self._target_speed = 0
+        self._tx_dirty = True
         
         # Send immediately for responsiveness
         # CRITICAL: Must echo last known position to avoid Sync Error
-        pos = self._last_known_position if self._last_known_position is not None else 0
-        packet = build_move_packet(MoveCode.STOP, speed=0, avg_pos=pos)
+        pos = self._last_known_position
+        packet = build_move_packet(MoveCode.STOP, 0, pos)
         
-        if self._client and self._is_connected:
+        if self._is_connected and self._client is not None:
             try:
                 await self.write_command(packet, response=False)
+                self._last_sent_packet = packet
+                self._last_send_t = asyncio.get_running_loop().time()
             except Exception as e:
                 # If immediate stop fails (e.g. Service Discovery error), just warn.
                 # The keep-alive loop will pick up the new _target_move_code = STOP shortly.
                 logger.warning(f"Immediate Stop Write Failed: {e}")
 
+    async def _request(self, cmd: int, timeout: float = 3.0):
+        """Sends a zero-payload query and waits for the handler to resolve its response."""
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[cmd] = fut
+        try:
+            await self.write_command(self._STATIC_PACKETS[cmd], response=True)
+            return await asyncio.wait_for(fut, timeout=timeout)
+        finally:
+            if self._pending.get(cmd) is fut:
+                del self._pending[cmd]
+
+    def _resolve(self, cmd: int, result):
+        fut = self._pending.get(cmd)
+        if fut is not None and not fut.done():
+            fut.set_result(result)
+
     async def get_stats(self):
-        self._stats_future = asyncio.get_event_loop().create_future()
-        packet = build_packet(CommandCode.GET_STATS)
-        await self.write_command(packet, response=True)
-        return await asyncio.wait_for(self._stats_future, timeout=3.0)
+        return await self._request(CommandCode.GET_STATS)
 
     async def get_version(self):
-        self._version_future = asyncio.get_event_loop().create_future()
-        packet = build_packet(CommandCode.GET_VERSION)
-        await self.write_command(packet, response=True)
-        return await asyncio.wait_for(self._version_future, timeout=3.0)
+        return await self._request(CommandCode.GET_VERSION)
 
     async def get_protocol_version(self):
-        self._proto_version_future = asyncio.get_event_loop().create_future()
-        packet = build_packet(CommandCode.GET_PROTOCOL_VERSION)
-        await self.write_command(packet, response=True)
-        return await asyncio.wait_for(self._proto_version_future, timeout=3.0)
-
-    async def set_smart_point(self, point: SmartPointCode):
-        """Sets a smart point (e.g. Soft Limit) at the current position."""
-        if not self._is_connected:
-             raise RuntimeError("Not connected")
-        packet = build_set_smart_point_packet(point)
-        await self.write_command(packet, response=False)
-        logger.info(f"Set Smart Point {point}")
-
-    async def clear_smart_point(self, point: SmartPointCode):
-        """Clears a smart point (e.g. Soft Limit)."""
-        if not self._is_connected:
-             raise RuntimeError("Not connected")
-        packet = build_clear_smart_point_packet(point)
-        await self.write_command(packet, response=False)
-        logger.info(f"Cleared Smart Point {point}")
+        return await self._request(CommandCode.GET_PROTOCOL_VERSION)
 
     def _notification_handler(self, sender, data):
         # logger.debug(f"RX: {data.hex()}")
         if not data:
             return
 
-        cmd = data[0]
+        # Parse fields straight out of the notification buffer; no payload copies
+        mv = memoryview(data)
+        cmd = mv[0]
         
-        # Authentication Handshake
-        if cmd == CommandCode.GET_PASSKEY:
-            if len(data) >= 8:
-                received_passkey = data[2:8]
-                logger.debug(f"Device Passkey: {received_passkey.hex()}")
-                self._passkey = received_passkey # Update stored passkey
-                asyncio.create_task(self._send_set_passkey(received_passkey))
-        
-        elif cmd == CommandCode.ACK:
-            if len(data) >= 3:
-                acked_cmd = data[2]
-                if acked_cmd == CommandCode.SET_PASSKEY:
-                    self._auth_event.set()
-
-        elif cmd == CommandCode.GET_STATS:
-            data_len = len(data)
-            if data_len >= 20: 
-                payload = data[2:]
-                _, total_time, _, _, _, err_cnt, err_classes = struct.unpack("<H I H H H H I", payload[:18])
-                if err_classes != 0:
-                    logger.warning(f"GET_STATS: Error Classes Bitmask: 0x{err_classes:08X}")
-                logger.info(f"Stats: Time={total_time}, ErrCnt={err_cnt}, ErrMask={err_classes}")
-            else:
-                logger.warning(f"GET_STATS Response too short: {data.hex()}")
-
-            if self._stats_future and not self._stats_future.done():
-                self._stats_future.set_result(data)
+        # One length check for every known response; handlers can unpack directly
+        if len(data) < _EXPECTED_LEN.get(cmd, 0):
+            logger.warning("Response 0x%02X too short: %s", cmd, data.hex())
+            # Fail a waiting query now rather than leaving it to time out
+            fut = self._pending.get(cmd)
+            if fut is not None and not fut.done():
+                fut.set_exception(ValueError(f"Response 0x{cmd:02X} too short: {len(data)} bytes"))
+            return
         
-        elif cmd == CommandCode.GET_VERSION:
-            if len(data) >= 10: # We need at least up to byte 7 (firmware.major) + 2 wrapper? No, payload is data[2:]
-                # Packet: [Cmd][Len][Payload...]
-                # Payload based on Java:
-                # 0: hw.minor
-                # 1: hw.major
-                # 2: hw.ver
-                # 3: factory_tag
-                # 4-5: unknown1
-                # 6: fw.minor
-                # 7: fw.major
+        handler = self._handlers.get(cmd)
+        if handler is not None:
+            handler(data, mv)
+
+    def _on_passkey(self, data, mv):
+        # Authentication Handshake
+        received_passkey = data[2:8]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Device Passkey: %s", received_passkey.hex())
+        self._passkey = received_passkey # Update stored passkey
+        self._passkey_packet = None
+        self._cmd_queue.put_nowait((self._send_set_passkey, received_passkey))
+
+    def _on_ack(self, data, mv):
+        acked_cmd = mv[2]
+        if acked_cmd == CommandCode.SET_PASSKEY:
+            if self._auth_future and not self._auth_future.done():
+                self._auth_future.set_result(True)
+
+    def _on_stats(self, data, mv):
+        _, total_time, _, _, _, err_cnt, err_classes = _STATS_STRUCT.unpack_from(mv, 2)
+        # One record per response; the warning only adds the error bitmask when set
+        if err_classes != 0 and logger.isEnabledFor(logging.WARNING):
+            logger.warning("GET_STATS: Time=%d ErrCnt=%d ErrMask=0x%08X", total_time, err_cnt, err_classes)
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("Stats: Time=%d ErrCnt=%d ErrMask=0x%08X", total_time, err_cnt, err_classes)
+
+        self._resolve(CommandCode.GET_STATS, bytes(data))
+
+    def _on_version(self, data, mv):
+        # Packet: [Cmd][Len][Payload...]
+        # Payload based on Java:
+        # 0: hw.minor
+        # 1: hw.major
+        # 2: hw.ver
+        # 3: factory_tag
+        # 4-5: unknown1
+        # 6: fw.minor
+        # 7: fw.major
+        try:
+            hw_min, hw_maj, hw_ver, fac_tag, _, fw_min, fw_maj = _VERSION_STRUCT.unpack_from(mv, 2)
+            
+            # Firmware Version = fw_maj.fw_min (e.g. 3.1)
+            # Hardware Version = hw_maj.hw_min.hw_ver
+            
+            version_str = f"{fw_maj}.{fw_min}" # Matches App display style (3.1)
+            # Optionally include build/etc if needed, but App seems to show X.Y
+            
+            logger.info("Firmware Version: %s (HW: %d.%d.%d)", version_str, hw_maj, hw_min, hw_ver)
+            
+            self._resolve(CommandCode.GET_VERSION, version_str)
+        except Exception as e:
+             logger.warning("GET_VERSION Parse Error: %s", e)
+
+    def _on_protocol_version(self, data, mv):
+        # Payload: 1 byte "version"
+        try:
+            raw_ver = mv[2]
+            # Guessing Nibble encoding: 0x41 -> 4.1
+            maj = (raw_ver >> 4) & 0x0F
+            min_ = raw_ver & 0x0F
+            ver_str = f"{maj}.{min_}"
                 
-                payload = data[2:]
-                if len(payload) >= 8:
-                    try:
-                        hw_min, hw_maj, hw_ver, fac_tag, _, fw_min, fw_maj = struct.unpack("<BBBB H BB", payload[:8])
-                        
-                        # Firmware Version = fw_maj.fw_min (e.g. 3.1)
-                        # Hardware Version = hw_maj.hw_min.hw_ver
-                        
-                        version_str = f"{fw_maj}.{fw_min}" # Matches App display style (3.1)
-                        # Optionally include build/etc if needed, but App seems to show X.Y
-                        
-                        logger.info(f"Firmware Version: {version_str} (HW: {hw_maj}.{hw_min}.{hw_ver})")
-                        
-                        if self._version_future and not self._version_future.done():
-                            self._version_future.set_result(version_str)
-                    except Exception as e:
-                         logger.warning(f"GET_VERSION Parse Error: {e}")
-                else:
-                    logger.warning(f"GET_VERSION Payload too short: {len(payload)}")
-            else:
-                 logger.warning(f"GET_VERSION Response too short: {data.hex()}")
+            logger.info("Protocol Version: %s (Raw: 0x%02X)", ver_str, raw_ver)
+            self._resolve(CommandCode.GET_PROTOCOL_VERSION, ver_str)
+        except:
+             self._resolve(CommandCode.GET_PROTOCOL_VERSION, "Unknown")
+
+    def _on_move(self, data, mv):
+        # Payload: 8 bytes, parsed in place after the [Cmd][Len] header.
+        move_status, error_code, pos, weight = _MOVE_STRUCT.unpack_from(mv, 2)
         
-        elif cmd == CommandCode.GET_PROTOCOL_VERSION:
-            # Payload: 1 byte "version"
-            if len(data) >= 3: 
-                payload = data[2:]
-                try:
-                    raw_ver = payload[0]
-                    # Guessing Nibble encoding: 0x41 -> 4.1
-                    maj = (raw_ver >> 4) & 0x0F
-                    min_ = raw_ver & 0x0F
-                    ver_str = f"{maj}.{min_}"
-                        
-                    logger.info(f"Protocol Version: {ver_str} (Raw: 0x{raw_ver:02X})")
-                    if self._proto_version_future and not self._proto_version_future.done():
-                        self._proto_version_future.set_result(ver_str)
-                except:
-                     if self._proto_version_future: self._proto_version_future.set_result("Unknown")
-            else:
-                logger.warning(f"GET_PROTOCOL_VERSION Response too short: {data.hex()}")
+        # CRITICAL: Always update position from device feedback
+        if pos != self._last_known_position or not self._has_first_pos:
+            self._last_known_position = pos
+            self._tx_dirty = True
+            self.current_distance = (self._cal_slope * pos) + self._cal_intercept
+        self._has_first_pos = True
+        self._last_known_weight = weight
+        self.last_error_code = error_code
+        if self._history is not None:
+            self._history.append((time.monotonic(), pos, weight, error_code))
+        # logger.debug(f"RX POS update: {pos}")
         
-        elif cmd == CommandCode.MOVE:
-            # Payload: 8 bytes.
-            payload = data[2:]
-            if len(payload) >= 8:
-                move_status, error_code, pos, weight = struct.unpack("<B B i H", payload[:8])
-                
-                # CRITICAL: Always update position from device feedback
-                self._last_known_position = pos
-                self._last_known_weight = weight
-                self.last_error_code = error_code
-                # logger.debug(f"RX POS update: {pos}")
-                
-                # Check if we should log this error (suppress duplicates)
-                if error_code != self._last_logged_error_code:
-                     if error_code != 0:
-                         if error_code == 0x86:
-                             logger.warning(f"End of Travel Reached (0x86) at Pos={pos}")
-                         elif error_code == 0x09:
-                             logger.error(f"Sync Error (0x09)! DevicePos={pos}, ClientLastKnown={self._last_known_position}")
-                         elif error_code == 0x81: # WarningSoftLimit
-                             logger.warning(f"Soft Limit Reached (0x81) at Pos={pos}")
-                         elif error_code == 0x83: # ErrorSmartPointNotSet
-                             logger.warning(f"Enable to Move: Smart Point Not Set (0x83) at Pos={pos}")
-                         else:
-                             logger.error(f"MOVE returned Error Code: {error_code} at Pos={pos}")
-                     self._last_logged_error_code = error_code
-                 
-                # Reset logged error if status returns to normal (0)
-                if error_code == 0:
-                    self._last_logged_error_code = 0
-            else:
-                logger.warning(f"MOVE Response too short: {data.hex()}")
+        # Check if we should log this error (suppress duplicates); 0 resets the suppression.
+        # The log call itself runs on the command worker, off the notification path.
+        if error_code != self._last_logged_error_code:
+            self._last_logged_error_code = error_code
+            if error_code != 0:
+                self._cmd_queue.put_nowait((self._log_move_error, (error_code, pos)))
+        
+        self._position_changed.set()
 
     async def set_calibration(self, code: int = 1):
         """Deprecated: Use set_smart_point instead."""
@@ -523,15 +749,13 @@ class PyLifterClient:
 
     async def set_smart_point(self, point: SmartPointCode):
         logger.info(f"Setting Smart Point: {point.name} ({point.value})...")
-        packet = build_packet(CommandCode.CALIBRATE, struct.pack("B", point.value))
-        async with self._write_lock:
-             await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+        packet = self._code_packet(CommandCode.CALIBRATE, point.value)
+        await self.write_command(packet, response=False)
 
     async def clear_smart_point(self, point: SmartPointCode):
         logger.info(f"Clearing Smart Point: {point.name} ({point.value})...")
         packet = build_clear_smart_point_packet(point)
-        async with self._write_lock:
-             await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+        await self.write_command(packet, response=False)
         
     async def override_move(self, direction: MoveCode, speed: int = 100):
         """
@@ -539,24 +763,25 @@ class PyLifterClient:
         """
         self._target_move_code = direction
         self._target_speed = speed
+        self._tx_dirty = True
+        self._wake_keep_alive()
         
-        pos = self._last_known_position if self._last_known_position is not None else 0
+        pos = self._last_known_position
         payload = struct.pack("<BBi", direction, speed, pos)
         packet = build_packet(CommandCode.GO_OVERRIDE, payload)
         
-        if self._client and self._is_connected:
+        if self._is_connected and self._client is not None:
              # logger.debug(f"TX OVERRIDE: Dir={direction}, Pos={pos}")
-             async with self._write_lock:
-                 await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+             await self.write_command(packet, response=False)
 
     async def clear_error(self):
+        """Sends CLEAR_ERROR. Use clear_error_and_wait() to confirm it landed before moving."""
         logger.info("Sending CLEAR_ERROR...")
-        packet = build_packet(CommandCode.CLEAR_ERROR)
+        packet = self._STATIC_PACKETS[CommandCode.CLEAR_ERROR]
         
         # Protect against Service Discovery errors during crash recovery
         try:
-            async with self._write_lock:
-                await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+            await self.write_command(packet, response=False)
         except Exception as e:
                 logger.warning(f"clear_error failed (Ignored): {e}")
 
@@ -565,11 +790,48 @@ class PyLifterClient:
         self.last_error_code = 0
         self._last_logged_error_code = 0
 
+    async def _next_move_report(self, deadline: float) -> bool:
+        """Waits for the next MOVE notification until loop time `deadline`. False on timeout."""
+        self._position_changed.clear()
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            return False
+        try:
+            await asyncio.wait_for(self._position_changed.wait(), timeout=remaining)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def clear_error_and_wait(self, timeout: float = 0.25) -> bool:
+        """
+        Sends CLEAR_ERROR and returns once a MOVE report shows error code 0, so a stale
+        error can't abort the next move. Returns False if not confirmed within `timeout`.
+        """
+        await self.clear_error()
+        deadline = asyncio.get_running_loop().time() + timeout
+        while await self._next_move_report(deadline):
+            if self.last_error_code == 0:
+                return True
+        return False
+
+    async def stop_and_wait(self, timeout: float = 0.5) -> bool:
+        """
+        Stops the winch and returns once two consecutive MOVE reports show the same
+        position. Returns False if it was still moving after `timeout`.
+        """
+        await self.stop()
+        deadline = asyncio.get_running_loop().time() + timeout
+        last_pos = self._last_known_position
+        while await self._next_move_report(deadline):
+            if self._last_known_position == last_pos:
+                return True
+            last_pos = self._last_known_position
+        return False
+
     async def go_override(self):
         logger.info("Sending GO_OVERRIDE...")
-        packet = build_packet(CommandCode.GO_OVERRIDE)
-        async with self._write_lock:
-             await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+        packet = self._STATIC_PACKETS[CommandCode.GO_OVERRIDE]
+        await self.write_command(packet, response=False)
         
         # Reset local error state
         self.last_error_code = 0
@@ -577,14 +839,23 @@ class PyLifterClient:
     
     async def factory_calibrate(self, code: int = 1):
         logger.info(f"Sending FACTORY_CALIBRATE (Code={code})...")
-        packet = build_packet(CommandCode.FACTORY_CALIBRATE, struct.pack("B", code))
-        await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+        packet = self._code_packet(CommandCode.FACTORY_CALIBRATE, code)
+        await self.write_command(packet, response=False)
 
     async def clear_calibration(self, code: int = 1):
         logger.info(f"Sending CLEAR_CALIBRATION (Code={code})...")
-        packet = build_packet(CommandCode.CLEAR_CALIBRATION, struct.pack("B", code))
-        await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=False)
+        packet = self._code_packet(CommandCode.CLEAR_CALIBRATION, code)
+        await self.write_command(packet, response=False)
+
+    def _get_passkey_packet(self) -> bytes:
+        """SET_PASSKEY packet for the stored passkey, built once per passkey."""
+        if self._passkey_packet is None:
+            self._passkey_packet = build_packet(CommandCode.SET_PASSKEY, self._passkey)
+        return self._passkey_packet
 
     async def _send_set_passkey(self, passkey: bytes):
-        packet = build_packet(CommandCode.SET_PASSKEY, passkey)
-        await self._client.write_gatt_char(COMMAND_CHAR_UUID, packet, response=True)
+        if passkey == self._passkey:
+            packet = self._get_passkey_packet()
+        else:
+            packet = build_packet(CommandCode.SET_PASSKEY, passkey)
+        await self.write_command(packet, response=True)
@@ -0,0 +1,45 @@
+
+import json
+import os
+
+# Config I/O on bytes: orjson when available (faster parse/encode), stdlib json otherwise.
+# Both paths write the same layout (2-space indent, UTF-8), so a hand-edited
+# pylifter_config.json isn't reformatted depending on what's installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_config(config: dict) -> bytes:
+    """Encodes the config as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode()
+
+def load_config(path: str) -> dict:
+    """Reads the config at `path`. Raises FileNotFoundError if it doesn't exist."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def save_config(path: str, config: dict):
+    """
+    Writes the config to a temp file in one write, fsyncs, then renames over `path`,
+    so a crash mid-save leaves the previous config intact. Skips the write entirely
+    when the file already holds the same bytes.
+    """
+    data = dumps_config(config)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
@@ -1,6 +1,7 @@
 
 import struct
 from enum import IntEnum
+from typing import NamedTuple
 
 # UUIDs
 MYLIFTER_SERVICE_UUID = "2d88fb13-e261-4eb9-934b-5a4fea3e3b25"
@@ -52,22 +53,27 @@ class SmartPointCode(IntEnum):
     TOP = 1
     BOTTOM = 2
 
+# Precompiled formats (avoids re-parsing the format string on every packet)
+_PKT_HDR = struct.Struct("BB")            # [Command Code][Payload Length]
+_POINT = struct.Struct("B")               # [Smart Point Code]
+_MOVE_RESP = struct.Struct("<BBih")       # [Status][Error][Position][Weight]
+# Full MOVE / GO_OVERRIDE packet: [Cmd][Len=6][Move Code][Speed][Avg Pos (4B, LE)]
+_MOVE_PACKET_STRUCT = struct.Struct("<BBBBi")
+MOVE_PACKET_LEN = _MOVE_PACKET_STRUCT.size
+
 def build_packet(command_code: int, payload: bytes = b'') -> bytes:
     """
     Constructs a MyLifter Bluetooth packet.
     Format: [Command Code (1B)][Payload Length (1B)][Payload]
     """
-    cmd_byte = struct.pack("B", command_code)
-    len_byte = struct.pack("B", len(payload))
-    return cmd_byte + len_byte + payload
+    return _PKT_HDR.pack(command_code, len(payload)) + payload
 
 def build_move_packet(move_code: MoveCode, speed: int = 100, avg_pos: int = 0) -> bytes:
     """
     Constructs a Move command packet.
     Payload: [Move Code (1B)][Speed (1B)][Avg Pos (4B, Little Endian)]
     """
-    payload = struct.pack("<BBi", move_code, speed, avg_pos)
-    return build_packet(CommandCode.MOVE, payload)
+    return _MOVE_PACKET_STRUCT.pack(CommandCode.MOVE, 6, move_code, speed, avg_pos)
 
 def build_override_packet(move_code: MoveCode, speed: int = 100, avg_pos: int = 0) -> bytes:
     """
@@ -75,26 +81,46 @@ def build_override_packet(move_code: MoveCode, speed: int = 100, avg_pos: int =
     Payload: [Move Code (1B)][Speed (1B)][Avg Pos (4B, Little Endian)]
     Uses CommandCode.GO_OVERRIDE (0x25) instead of MOVE.
     """
-    payload = struct.pack("<BBi", move_code, speed, avg_pos)
-    return build_packet(CommandCode.GO_OVERRIDE, payload)
+    return _MOVE_PACKET_STRUCT.pack(CommandCode.GO_OVERRIDE, 6, move_code, speed, avg_pos)
+
+# Constant STOP at position 0 (for raw scripts that don't track position)
+STOP_PACKET = build_move_packet(MoveCode.STOP, speed=0, avg_pos=0)
+
+def build_move_packet_into(buf: bytearray, move_code: MoveCode, speed: int = 100, avg_pos: int = 0):
+    """
+    Writes a Move command packet into `buf` (at least MOVE_PACKET_LEN bytes) in place.
+    Same bytes as build_move_packet, without allocating a new packet.
+    """
+    _MOVE_PACKET_STRUCT.pack_into(buf, 0, CommandCode.MOVE, 6, move_code, speed, avg_pos)
+
+def build_override_packet_into(buf: bytearray, move_code: MoveCode, speed: int = 100, avg_pos: int = 0):
+    """
+    Writes an Override command packet into `buf` in place.
+    Same bytes as build_override_packet (CommandCode.GO_OVERRIDE).
+    """
+    _MOVE_PACKET_STRUCT.pack_into(buf, 0, CommandCode.GO_OVERRIDE, 6, move_code, speed, avg_pos)
 
 def build_set_smart_point_packet(point: SmartPointCode) -> bytes:
     """
     Constructs a Calibrate (Set Smart Point) command packet.
     Payload: [Smart Point Code (1B)]
     """
-    payload = struct.pack("B", point)
-    return build_packet(CommandCode.CALIBRATE, payload)
+    return build_packet(CommandCode.CALIBRATE, _POINT.pack(point))
 
 def build_clear_smart_point_packet(point: SmartPointCode) -> bytes:
     """
     Constructs a Clear Calibration command packet.
     Payload: [Smart Point Code (1B)]
     """
-    payload = struct.pack("B", point)
-    return build_packet(CommandCode.CLEAR_CALIBRATION, payload)
+    return build_packet(CommandCode.CLEAR_CALIBRATION, _POINT.pack(point))
 
-def parse_move_response(payload: bytes) -> dict:
+class MoveResponse(NamedTuple):
+    move_status: int
+    error_code: int
+    position: int
+    weight: int
+
+def parse_move_response(payload: bytes) -> MoveResponse:
     """
     Parses the response to a Move command.
     Payload: [Status (1B)][Error (1B)][Position (4B)][Weight (2B)]
@@ -106,12 +132,5 @@ def parse_move_response(payload: bytes) -> dict:
     if len(payload) != 8:
         raise ValueError(f"Invalid move response length: {len(payload)}, expected 8")
     
-    move_status, error_code, position, weight = struct.unpack("<BBih", payload)
-    
-    return {
-        "move_status": move_status,
-        "error_code": error_code,
-        "position": position,
-        "weight": weight
-    }
+    return MoveResponse._make(_MOVE_RESP.unpack_from(payload))
 
@@ -1,7 +1,9 @@
 
 import asyncio
 import logging
+import os
 from pylifter import PyLifterClient, MoveCode
+from pylifter.config import load_config, save_config
 
 # Configure logging to show only critical errors from the library, 
 # so our print statements are clean.
@@ -9,15 +11,18 @@ logging.basicConfig(level=logging.WARNING)
 
 async def monitor_position(client: PyLifterClient, duration: float):
     """Monitors and prints the winch position for a set duration."""
-    end_time = asyncio.get_event_loop().time() + duration
-    while asyncio.get_event_loop().time() < end_time:
+    now = asyncio.get_running_loop().time
+    next_t = now()
+    end_time = next_t + duration
+    while now() < end_time:
         pos = client._last_known_position
         dist = client.current_distance
         print(f"  -> Pos: {pos:<6} | Dist: {dist:.1f} cm")
-        await asyncio.sleep(0.5)
+        # Fixed 0.5s grid: print time doesn't push later samples back
+        next_t += 0.5
+        await asyncio.sleep(max(0.0, next_t - now()))
 
 async def main():
-    import json
     # Resolve config path relative to this script
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_file = os.path.join(script_dir, "pylifter_config.json")
@@ -29,24 +34,23 @@ async def main():
 
     # 1. Load Config
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            # Support new schema (devices list)
-            devices = config.get("devices", [])
-            if devices:
-                # Default to first device
-                dev = devices[0]
-                mac_address = dev.get("mac_address", mac_address)
-                passkey = dev.get("passkey")
-                # Calibration is global now
-                calibration = config.get("calibration", {})
-                print(f"[Config] Loaded Device 1: {mac_address}")
-            else:
-                 # Legacy fallback check
-                 mac_address = config.get("mac_address", mac_address)
-                 passkey = config.get("passkey")
-                 calibration = config.get("calibration", {})
-                 print(f"[Config] Loaded config for {mac_address}")
+        config = load_config(config_file)
+        # Support new schema (devices list)
+        devices = config.get("devices", [])
+        if devices:
+            # Default to first device
+            dev = devices[0]
+            mac_address = dev.get("mac_address", mac_address)
+            passkey = dev.get("passkey")
+            # Calibration is global now
+            calibration = config.get("calibration", {})
+            print(f"[Config] Loaded Device 1: {mac_address}")
+        else:
+             # Legacy fallback check
+             mac_address = config.get("mac_address", mac_address)
+             passkey = config.get("passkey")
+             calibration = config.get("calibration", {})
+             print(f"[Config] Loaded config for {mac_address}")
     except FileNotFoundError:
         print("[Config] No config file found. Using defaults.")
 
@@ -67,8 +71,7 @@ async def main():
         # Save passkey if newly acquired or config missing
         if client.passkey and client.passkey != passkey:
              config["passkey"] = client.passkey.hex() if isinstance(client.passkey, bytes) else client.passkey
-             with open(config_file, "w") as f:
-                 json.dump(config, f, indent=4)
+             save_config(config_file, config)
              print(f"   [Persistence] Updated passkey in {config_file}")
         
         # 3. Move UP
@@ -1,15 +1,24 @@
 import asyncio
 import logging
-import json
-import curses
 import os
+import random
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from bleak import BleakScanner
-from pylifter.protocol import MoveCode, SmartPointCode
+from pylifter.protocol import MoveCode, SmartPointCode, MYLIFTER_SERVICE_UUID
 from pylifter.client import PyLifterClient, TESTED_FIRMWARE_VERSIONS, MoveCode, SmartPointCode
+from pylifter.config import load_config, save_config
 
 import argparse
 
+# One long-lived thread for blocking input() instead of borrowing the default pool per prompt
+_input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="winch-input")
+
+async def wait_for_input(prompt):
+    return await asyncio.get_running_loop().run_in_executor(_input_executor, input, prompt)
+
 # Configure logs
 def configure_logging(enable_debug_file: bool = False):
     root_logger = logging.getLogger()
@@ -34,25 +43,27 @@ def configure_logging(enable_debug_file: bool = False):
     logging.getLogger("bleak").setLevel(logging.DEBUG)
 
 
-async def check_firmware_support(version: str):
+async def check_firmware_support(version: str, assume_ok: bool = False):
     """
     Checks if the firmware version is in the tested list. 
     If not, warns the user and prompts to continue or exit.
+    assume_ok=True (--assume-compatible / PYLIFTER_YES=1) warns in one line and never prompts.
     """
-    if version not in TESTED_FIRMWARE_VERSIONS:
+    if version not in TESTED_FIRMWARE_VERSIONS and assume_ok:
+        print(f" WARNING: Untested firmware {version} (tested: {', '.join(sorted(TESTED_FIRMWARE_VERSIONS))}). Continuing.")
+    elif version not in TESTED_FIRMWARE_VERSIONS:
         print("\n" + "="*60)
         print(f" WARNING: UNTESTED FIRMWARE VERSION DETECTED!")
         print(f" Current Version: {version}")
-        print(f" Tested Versions: {', '.join(TESTED_FIRMWARE_VERSIONS)}")
+        print(f" Tested Versions: {', '.join(sorted(TESTED_FIRMWARE_VERSIONS))}")
         print("="*60)
         print(" Using this software with untested firmware may produce unpredictable results.")
         print(" Please use the official MyLifter app to update your winch firmware to a tested version.")
         print("="*60)
         
         while True:
-            # Use run_in_executor to avoid blocking the asyncio loop (and keep-alives)
-            print(" Press 'C' to CONTINUE anyway, or press ENTER to EXIT: ", end='', flush=True)
-            choice = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+            # Read on the input thread to avoid blocking the asyncio loop (and keep-alives)
+            choice = await wait_for_input(" Press 'C' to CONTINUE anyway, or press ENTER to EXIT: ")
             choice = choice.strip().upper()
             
             if choice == 'C':
@@ -67,82 +78,137 @@ async def check_firmware_support(version: str):
 # ANSI Escape Codes
 ANSI_UP = "\033[A"
 ANSI_CLEAR = "\033[K"
+ANSI_HIDE_CURSOR = "\033[?25l"
+ANSI_SHOW_CURSOR = "\033[?25h"
+# Synchronized update (DEC mode 2026): the terminal paints the frame at once; ignored where unsupported
+CSI_SYNC_BEGIN = "\033[?2026h"
+CSI_SYNC_END = "\033[?2026l"
+# Alternate screen buffer (+ cursor home): the dashboard draws on its own screen, scrollback untouched
+ANSI_ALT_SCREEN_ON = "\033[?1049h\033[H"
+ANSI_ALT_SCREEN_OFF = "\033[?1049l"
+
+MONITOR_FPS = 10
 
 class LiveStatusMonitor:
     def __init__(self, clients, target_ids):
         self.clients = clients
         self.target_ids = target_ids
         self.statuses = {cid: "Waiting..." for cid in target_ids}
+        # "  [ 1] XX:XX:XX:XX:XX:XX" never changes while the monitor runs - format it once
+        self._prefix = {cid: f"  [{cid:>2}] {clients[cid].mac_address}" for cid in target_ids if cid in clients}
         self.active = True
-        self.lock = asyncio.Lock()
+        # Set by update_status when a message actually changes; cleared once the frame is drawn
+        self._dirty = True
+        # Only on a real terminal - escape codes would corrupt piped output
+        self._alt_screen = False
+        self._task = None
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self.run())
+        # Let run() allocate its rows before any caller output can race it
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Always stop, even when a worker raised, so the monitor task never outlives the command
+        self.stop()
+        await self._task
         
     def update_status(self, client_id, message):
-        self.statuses[client_id] = message
+        if self.statuses.get(client_id) != message:
+            self.statuses[client_id] = message
+            self._dirty = True
+
+    def _format_line(self, cid, final: bool) -> str:
+        client = self.clients.get(cid)
+        status_msg = self.statuses.get(cid, "Done" if final else "Unknown")
+        if not client:
+            if final:
+                return f"  [{cid:>2}] Not Found"
+            return f"  [{cid:>2}] {'Unknown':<17} | {'':<4} | {'':<5} {'':<8} | {'':<6} | {status_msg}"
+        
+        # Compact Connection Status
+        conn = "Conn" if client._is_connected else "Disc"
+        
+        # Full MAC Grid Format (User Preferences)
+        # [ 1] XX:XX:XX:XX:XX:XX | Conn | 123.4 cm | Weight: 1234 | Status
+        prefix = self._prefix.get(cid) or f"  [{cid:>2}] {client.mac_address}"
+        return f"{prefix} | {conn:<4} | {client.current_distance:>5.1f} cm | Weight: {client.current_weight:>4} | {status_msg}"
+
+    def _snapshot(self) -> tuple:
+        # Client-side values shown on screen; status messages are tracked by _dirty instead
+        clients = self.clients
+        snap = []
+        for cid in self.target_ids:
+            c = clients.get(cid)
+            if c is not None:
+                snap.append((c._is_connected, round(c.current_distance, 1), c.current_weight))
+        return tuple(snap)
+
+    def _write_frame(self, final: bool = False):
+        # Whole frame (cursor-up + every row) in one write, so the terminal never shows a half-drawn update
+        buf = [CSI_SYNC_BEGIN, ANSI_UP * len(self.target_ids)]
+        for cid in self.target_ids:
+            buf.append(self._format_line(cid, final))
+            buf.append(ANSI_CLEAR + "\n")
+        buf.append(CSI_SYNC_END)
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+
+    def _leave_alt_screen(self):
+        if self._alt_screen:
+            self._alt_screen = False
+            sys.stdout.write(ANSI_SHOW_CURSOR + ANSI_ALT_SCREEN_OFF)
+            sys.stdout.flush()
 
     async def run(self):
         # Initial Print (Allocate lines)
-        for cid in self.target_ids:
-            print(f"  [{cid}] Waiting...")
+        if sys.stdout.isatty():
+            self._alt_screen = True
+            sys.stdout.write(ANSI_ALT_SCREEN_ON)
+        sys.stdout.write(ANSI_HIDE_CURSOR + "".join(f"  [{cid}] Waiting...\n" for cid in self.target_ids))
+        sys.stdout.flush()
             
+        loop = asyncio.get_running_loop()
+        frame_interval = 1.0 / MONITOR_FPS
+        next_t = loop.time()
+        last_snapshot = None
         try:
             while self.active:
-                # Move cursor up N lines
-                print(f"{ANSI_UP * len(self.target_ids)}", end='', flush=True)
-                
-                for cid in self.target_ids:
-                    client = self.clients.get(cid)
-                    status_msg = self.statuses.get(cid, "Unknown")
-                    
-                    # Format:   [1] AA:BB:CC... | UP   | Pos: 123 | 45.0 cm | Status Msg
-                    if client:
-                        mac = client.mac_address
-                        # Compact MAC (last 8 chars: "FE:15:33")
-                        mac_short = mac[-8:] if mac else "??:??:??"
-                        
-                        pos = client._last_known_position
-                        pos_str = str(pos) if pos is not None else "?"
-                        dist = client.current_distance
-                        wgt = client.current_weight
-                        
-                        # Compact Connection Status
-                        conn = "Conn" if client._is_connected else "Disc"
-                        
-                        # Full MAC Grid Format (User Preferences)
-                        # [ 1] XX:XX:XX:XX:XX:XX | Conn | 123.4 cm | Weight: 1234 | Status
-                        line = f"  [{cid:>2}] {mac} | {conn:<4} | {dist:>5.1f} cm | Weight: {wgt:>4} | {status_msg}"
-
-                    else:
-                        line = f"  [{cid:>2}] {'Unknown':<17} | {'':<4} | {'':<5} {'':<8} | {'':<6} | {status_msg}"
-                        
-                    print(f"{line}{ANSI_CLEAR}")
-                
-                await asyncio.sleep(0.1)
+                # Redraw only when something shown on screen changed
+                snapshot = self._snapshot()
+                if self._dirty or snapshot != last_snapshot:
+                    self._dirty = False
+                    self._write_frame()
+                    last_snapshot = snapshot
+                # Fixed-rate deadline: formatting/IO time doesn't stretch the frame period
+                next_t += frame_interval
+                now = loop.time()
+                if next_t < now:
+                    next_t = now
+                await asyncio.sleep(next_t - now)
         except Exception as e:
             # Print exception to debug what's going on
             print(f"\n[Monitor Error] {e}")
             import traceback
             traceback.print_exc() 
+        finally:
+            self._leave_alt_screen()
+            sys.stdout.write(ANSI_SHOW_CURSOR)
+            sys.stdout.flush()
 
 
     def stop(self):
         self.active = False
-        # Do one final print without moving up to leave state
+        # Do one final print to leave state
         try:
-             print(f"{ANSI_UP * len(self.target_ids)}", end='', flush=True)
-             for cid in self.target_ids:
-                client = self.clients.get(cid)
-                status_msg = self.statuses.get(cid, "Done")
-                if client:
-                    mac = client.mac_address
-                    pos = client._last_known_position
-                    wgt = client.current_weight
-                    conn = "Conn" if client._is_connected else "Disc"
-                    
-                    line = f"  [{cid:>2}] {mac} | {conn:<4} | {client.current_distance:>5.1f} cm | Weight: {wgt:>4} | {status_msg}"
-
-                else:
-                    line = f"  [{cid:>2}] Not Found"
-                print(f"{line}{ANSI_CLEAR}")
+            if self._alt_screen:
+                # Back on the main screen, print the final state as plain lines so it stays in scrollback
+                self._leave_alt_screen()
+                sys.stdout.write("".join(self._format_line(cid, True) + "\n" for cid in self.target_ids))
+                sys.stdout.flush()
+            else:
+                self._write_frame(final=True)
         except:
             pass
 
@@ -181,76 +247,100 @@ async def background_reconnect_loop(clients: dict):
             logging.getLogger("pylifter").error(f"Reconnect Loop Error: {e}")
             await asyncio.sleep(5.0)
 
-async def monitor_move(client: PyLifterClient, target_pos: int, direction: MoveCode, client_id: int, speed: int = 100, monitor: LiveStatusMonitor = None):
+def _connection_lost(client: PyLifterClient) -> bool:
+    return not client._is_connected or (client._client and not client._client.is_connected)
+
+async def _wait_for_report(client: PyLifterClient, timeout: float = 0.5) -> bool:
+    """
+    Waits for the next MOVE notification (position / error code). The caller clears
+    client._position_changed *before* reading state, so a report landing mid-check isn't lost.
+    The timeout guards against a lost notification. Returns False on timeout.
+    """
+    try:
+        await asyncio.wait_for(client._position_changed.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+async def monitor_move(client: PyLifterClient, target_pos: int, direction: MoveCode, client_id: int, speed: int = 100, monitor: LiveStatusMonitor = None, clear_first: bool = True):
     """
     Moves the winch in 'direction' until 'target_pos' is reached.
     Updates 'monitor' with status strings instead of printing.
+    clear_first=False when the caller already cleared errors (batched across winches).
     """
+    last_msg = None
     def log(msg):
+        # The loop re-posts the same running status on every report - only pass on changes
+        nonlocal last_msg
+        if msg == last_msg:
+            return
+        last_msg = msg
         if monitor: monitor.update_status(client_id, msg)
         else: print(f"[Winch {client_id}] {msg}")
 
     # Safety Check
     start_pos = client._last_known_position
-    if start_pos is None:
+    if not client._has_first_pos:
         log("Error: Unknown start position.")
         return
 
-    log(f"Moving {'UP' if direction == MoveCode.UP else 'DOWN'} -> {target_pos} ({speed}%)")
+    # Direction-dependent values, fixed for the whole move
+    up = direction == MoveCode.UP
+    label = "UP" if up else "DOWN"
+    end = "Top" if up else "Bottom"
+    hw_msg = f"Reached {end} Limit (Hardware)."
+    soft_msg = f"Reached {end} Soft Limit."
+    moving_msg = f"Moving {label}... ({speed}%)"
+    # (pos - target) * sign >= 0 <=> target reached in this direction
+    sign = 1 if up else -1
+    
+    log(f"Moving {label} -> {target_pos} ({speed}%)")
     
     if not client._is_connected:
         log("Not Connected! Aborting.")
         return
 
-    await client.clear_error()
-    await asyncio.sleep(0.25)
+    # Returns as soon as the device reports the error cleared (0.25s max, the old fixed settle time)
+    if clear_first:
+        await client.clear_error_and_wait()
     
     await client.move(direction, speed=speed)
     
     try:
         while True:
+            # Clear before reading state so a notification landing mid-check still wakes the next wait
+            client._position_changed.clear()
+            
             # Robust Connection Check
-            if not client._is_connected or (client._client and not client._client.is_connected):
+            if _connection_lost(client):
                 log("Connection Lost!")
                 break
 
-            current_pos = client._last_known_position
-            
             # Check Limits
-            if direction == MoveCode.UP:
-                if current_pos >= target_pos: 
-                    log("Target Reached.")
-                    break
-                if client.last_error_code == 0x86:
-                     log("Reached Top Limit (Hardware).")
-                     break
-                if client.last_error_code == 0x81:
-                     log("Reached Top Soft Limit.")
-                     await client.stop()
-                     break
-
-            else:
-                if current_pos <= target_pos: 
-                    log("Target Reached.")
-                    break
-                if client.last_error_code == 0x86:
-                     log("Reached Bottom Limit (Hardware).")
-                     break
-                if client.last_error_code == 0x81:
-                     log("Reached Bottom Soft Limit.")
-                     await client.stop()
-                     break
+            if (client._last_known_position - target_pos) * sign >= 0:
+                log("Target Reached.")
+                break
+            err = client.last_error_code
+            if err == 0x86:
+                log(hw_msg)
+                break
+            if err == 0x81:
+                log(soft_msg)
+                await client.stop()
+                break
             
             # Update running status
-            log(f"Moving {'UP' if direction == MoveCode.UP else 'DOWN'}... ({speed}%)")
-            await asyncio.sleep(0.1)
+            log(moving_msg)
+            
+            # Wake on the next position notification; the timeout keeps the connection check live
+            await _wait_for_report(client)
             
     finally:
-        await client.stop()
-        await asyncio.sleep(0.5) 
+        # Returns once the position settles (0.5s max, the old fixed settle time)
+        await client.stop_and_wait()
         log("Stopped.")
 
-async def monitor_smart_move(client: PyLifterClient, direction: MoveCode, client_id: int, monitor: LiveStatusMonitor = None):
+async def monitor_smart_move(client: PyLifterClient, direction: MoveCode, client_id: int, monitor: LiveStatusMonitor = None, clear_first: bool = True):
     """
     Monitors a 'Smart Move' (LIFT/LOWER).
     """
@@ -261,17 +351,28 @@ async def monitor_smart_move(client: PyLifterClient, direction: MoveCode, client
     limit_name = "TOP" if direction == MoveCode.SMART_UP else "BOTTOM"
     log(f"Smart Moving {limit_name}...")
     
-    await client.clear_error()
-    await asyncio.sleep(0.25)
+    # Returns as soon as the device reports the error cleared (0.25s max, the old fixed settle time)
+    if clear_first:
+        await client.clear_error_and_wait()
     
     await client.move(direction, speed=100)
     
     last_pos = client._last_known_position
-    stable_count = 0
+    # Stall timers on the loop clock: wakeups follow notifications, so counting loop passes wouldn't mean ~2s
+    now = asyncio.get_running_loop().time
+    stable_since = last_report_t = now()
     
     try:
         while True:
+            # Clear before reading state so a notification landing mid-check still wakes the next wait
+            client._position_changed.clear()
+            
+            if _connection_lost(client):
+                log("Connection Lost!")
+                break
+            
             current_pos = client._last_known_position
+            t = now()
             
             if client.last_error_code == 0x86:
                  log("Reached Hardware Limit.")
@@ -285,59 +386,158 @@ async def monitor_smart_move(client: PyLifterClient, direction: MoveCode, client
             
             # Stall Detection (Smart Move implies auto-stop, but we check specific conditions)
             if current_pos == last_pos:
-                stable_count += 1
-                if stable_count > 20: 
+                if t - stable_since > 2.0:
                     log("Movement Stopped (Stable).")
                     break
             else:
-                stable_count = 0
+                stable_since = t
                 last_pos = current_pos
             
             log(f"Smart Moving {limit_name}...")
-            await asyncio.sleep(0.1)
+            
+            # Wake on the next MOVE notification (position / error code); a link silent for 2s means it stopped
+            if await _wait_for_report(client):
+                last_report_t = now()
+            elif now() - last_report_t > 2.0:
+                log("Movement Stopped (No Updates).")
+                break
             
     finally:
-        await client.stop()
-        await asyncio.sleep(0.5)
+        # Returns once the position settles (0.5s max, the old fixed settle time)
+        await client.stop_and_wait()
         log("Stopped.")
 
-async def pair_new_winch(config_file, config, clients):
+# address -> (BLEDevice, matched name?, monotonic time seen), fed by every pairing scan
+_scan_cache = {}
+SCAN_CACHE_MAX_AGE = 15.0
+
+def _recent_scan(max_age: float = SCAN_CACHE_MAX_AGE):
+    """Winches seen by a scan within `max_age` seconds, as (matched, unnamed) like scan_for_winches."""
+    cutoff = time.monotonic() - max_age
+    found, unnamed = [], []
+    for dev, matched, seen in _scan_cache.values():
+        if seen >= cutoff:
+            (found if matched else unnamed).append(dev)
+    return found, unnamed
+
+async def scan_for_winches(timeout: float = 5.0, first_only: bool = False, min_window: float = 1.0, on_found=None):
+    """
+    Scans for MyLifter winches. The service UUID filter is applied by the OS/adapter,
+    so unrelated advertisements never reach Python. Only BLEDevice refs are kept.
+    Ends at the first match with `first_only`, otherwise once a match is found and
+    `min_window` has passed (so nearby winches advertising together are all listed).
+    With `on_found(device, matched)`, each new device is reported as it's seen and the
+    scan runs the full `timeout` (or until cancelled) unless `first_only`.
+    Returns (name-matched devices, unnamed devices advertising the service).
+    """
+    found = {}
+    unnamed = {}
+    done = asyncio.Event()
+
+    def on_detect(device, adv):
+        # Name may only arrive in the scan response; fall back to the device name
+        name = (adv.local_name or device.name or "").lower()
+        if name.startswith(("mylifter", "levitation")):
+            new = device.address not in found
+            found[device.address] = device
+            unnamed.pop(device.address, None)
+            if new and on_found:
+                on_found(device, True)
+            if first_only:
+                done.set()
+        elif device.address not in found:
+            if device.address not in unnamed and on_found:
+                on_found(device, False)
+            unnamed[device.address] = device
+
+    # Active scanning requests the scan response, where the name often lives, on first sight
+    scanner = BleakScanner(detection_callback=on_detect, service_uuids=[MYLIFTER_SERVICE_UUID],
+                           scanning_mode="active")
+    await scanner.start()
+    try:
+        if not first_only and on_found is None:
+            min_window = min(min_window, timeout)
+            await asyncio.sleep(min_window)
+            if found:
+                return list(found.values()), list(unnamed.values())
+            # Nothing yet - end on the first match from here on
+            first_only = True
+            timeout -= min_window
+        await asyncio.wait_for(done.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await scanner.stop()
+        now = time.monotonic()
+        for addr, dev in found.items():
+            _scan_cache[addr] = (dev, True, now)
+        for addr, dev in unnamed.items():
+            _scan_cache[addr] = (dev, False, now)
+    return list(found.values()), list(unnamed.values())
+
+async def pair_new_winch(config, clients, first_only: bool = False, assume_compatible: bool = False):
+    """Pairs a new winch into `config`. Returns True if config was modified (caller saves)."""
     print("\n--- Pairing Mode ---")
-    print("Scanning for devices...")
-    devices = await BleakScanner.discover()
-    
-    # Filter or just show all
-    mylifters = [d for d in devices if d.name and ("mylifter" in d.name.lower() or "levitation" in d.name.lower())] # Case insensitive
-    
-    if not mylifters:
-        print("No MyLifter devices found (Check filters or scan again).")
-        # Fallback to show all named devices
-        mylifters = [d for d in devices if d.name]
+    # Determine next ID
+    devices = config.get("devices", [])
+    next_id = max((d['id'] for d in devices), default=0) + 1
+    paired_macs = {d['mac_address'].upper() for d in devices}
+
+    # Devices in the order they were numbered on screen
+    listed = []
+    listed_addrs = set()
+
+    def show(d, matched=True):
+        if d.address in listed_addrs:
+            return
+        listed_addrs.add(d.address)
+        listed.append(d)
+        note = " [already paired]" if d.address.upper() in paired_macs else ""
+        tag = "" if matched else " [unnamed]"
+        print(f"{len(listed)}. {d.name or 'Unknown'} ({d.address}){tag}{note}")
 
-    for i, d in enumerate(mylifters):
-        print(f"{i+1}. {d.name} ({d.address})")
+    # Reuse a scan from the last few seconds (e.g. retrying a pairing); otherwise list devices
+    # as they're seen and take the selection while the scan is still running
+    scan_task = None
+    mylifters, unnamed = _recent_scan()
+    if mylifters:
+        print(f"Using recent scan results... (next ID will be {next_id})")
+        for d in mylifters:
+            show(d)
+    else:
+        print(f"Scanning for devices... (next ID will be {next_id}) - select as soon as yours appears")
+        scan_task = asyncio.create_task(scan_for_winches(timeout=10.0, first_only=first_only, on_found=show))
 
-    sel = await asyncio.get_event_loop().run_in_executor(None, input, "Select device # (or 0 to cancel): ")
+        def scan_done(t):
+            if not t.cancelled() and not listed:
+                print("\nNo MyLifter devices found (Check filters or scan again).")
+        scan_task.add_done_callback(scan_done)
+
+    try:
+        sel = await wait_for_input("Select device # (or 0 to cancel): ")
+    finally:
+        if scan_task is not None and not scan_task.done():
+            # Selection made - free the adapter before connecting
+            scan_task.cancel()
+            try:
+                await scan_task
+            except asyncio.CancelledError:
+                pass
     try:
         idx = int(sel) - 1
-        if idx < 0 or idx >= len(mylifters):
+        if idx < 0 or idx >= len(listed):
             print("Cancelled.")
-            return
+            return False
     except:
-        return
+        return False
 
-    device = mylifters[idx]
-    
-    # Determine next ID
-    existing_ids = [d['id'] for d in config.get("devices", [])]
-    next_id = 1
-    if existing_ids:
-        next_id = max(existing_ids) + 1
+    device = listed[idx]
         
     print(f"Pairing {device.name} as ID {next_id}...")
     print("!!! PRESS THE BUTTON ON THE WINCH NOW !!!")
     
-    client = PyLifterClient(device.address)
+    client = PyLifterClient(device.address, device=device)
+    added = False
     try:
         # Don't wait for position sync during pairing (avoids warning)
         await client.connect(wait_for_position=False)
@@ -347,7 +547,7 @@ async def pair_new_winch(config_file, config, clients):
             print("[ERROR] Pairing Failed: No passkey received from device.")
             print("        Make sure you pressed the button on the winch when prompted.")
             await client.disconnect()
-            return
+            return False
 
         print("Paired successfully.")
         
@@ -361,57 +561,46 @@ async def pair_new_winch(config_file, config, clients):
         if "devices" not in config: config["devices"] = []
         config["devices"].append(new_device_entry)
         
-        # Save
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=4)
-            
-        print("Saved to config.")
+        added = True # Saved by the REPL before its next prompt
         
         # Setup Calibration (Global)
         calibration = config.get("calibration", {})
         slope = calibration.get("slope", 1.0)
         intercept = calibration.get("intercept", 0.0)
         
-        # Disconnect pairing client to ensure clean state
-        await client.disconnect()
-        await asyncio.sleep(1.0)
-        
-        # Reconnect with fresh client (mimic startup)
+        # Keep the pairing link: authenticate and start keep-alive on it (no reconnect)
         print("Connecting to new winch...")
-        new_client = PyLifterClient(device.address, passkey=client.passkey.hex())
-        new_client.set_unit_calibration(slope, intercept)
-        await new_client.connect()
+        await client.finalize_pairing(client.passkey)
+        client.set_unit_calibration(slope, intercept)
         print("Connected.")
         
-        # STABILITY FIX: Wait for BLE stack to settle
-        await asyncio.sleep(1.5)
-        
         try:
-            ver = await new_client.get_version()
-            proto_ver = await new_client.get_protocol_version()
+            ver, proto_ver = await asyncio.gather(client.get_version(), client.get_protocol_version())
             print(f"Firmware Version: {ver}")
             print(f"Protocol Version: {proto_ver}")
             
-            await check_firmware_support(ver)
+            await check_firmware_support(ver, assume_ok=assume_compatible)
         except Exception as ve:
             print(f"[Warning] Could not verify firmware version: {ve}")
         
         # Add to active clients
-        clients[next_id] = new_client
+        clients[next_id] = client
         
     except Exception as e:
         print(f"Pairing failed/aborted: {e}")
         if client._is_connected:
              await client.disconnect()
+    return added
 
 
 
-async def unpair_winch(config_file, config, clients):
+async def unpair_winch(config, clients):
+    """Removes a winch from `config` and renumbers. Returns True if config was modified (caller saves)."""
     print("\n--- Unpair Mode ---")
     devices = config.get("devices", [])
     if not devices:
         print("No devices configured.")
-        return
+        return False
 
     for dev in devices:
         did = dev['id']
@@ -419,18 +608,18 @@ async def unpair_winch(config_file, config, clients):
         status = "Connected" if did in clients and clients[did]._is_connected else "Disconnected"
         print(f"ID {did}: {mac} ({status})")
 
-    sel = await asyncio.get_event_loop().run_in_executor(None, input, "Select ID to UNPAIR (or 0 to cancel): ")
+    sel = await wait_for_input("Select ID to UNPAIR (or 0 to cancel): ")
     try:
         target_id = int(sel)
-        if target_id == 0: return
+        if target_id == 0: return False
     except:
-        return
+        return False
 
     # Find device in list
     dev_entry = next((d for d in devices if d['id'] == target_id), None)
     if not dev_entry:
         print("Invalid ID.")
-        return
+        return False
 
     print(f"Unpairing ID {target_id}...")
     
@@ -440,8 +629,8 @@ async def unpair_winch(config_file, config, clients):
         if clients[target_id]._is_connected:
             print(f"Disconnecting ID {target_id}...", end='', flush=True)
             await clients[target_id].disconnect()
-            # Wait for stack to settle invisibly
-            await asyncio.sleep(2.0)
+            # Wait for the stack to report the link down (2s max, the old fixed settle time)
+            await clients[target_id].wait_disconnected(timeout=2.0)
             print(" Disconnected.")
         else:
             print(f"Skipping disconnect for ID {target_id} (Already Disconnected).")
@@ -476,12 +665,97 @@ async def unpair_winch(config_file, config, clients):
     clients.clear()
     clients.update(new_clients_map)
     
-    with open(config_file, "w") as f:
-        json.dump(config, f, indent=4)
-        
     print("Unpaired and configuration updated.")
+    return True
+
+def print_help():
+    print("\n--- Command Help ---")
+    print("Syntax: [ID,ID...|ALL] <COMMAND> [ARGS]")
+    print("  (If no ID is specified, Command applies to ID 1)")
+    print("\nAvailable Commands:")
+    print("  U <val> [spd] : Move UP by <val> cm, optional speed 25-100% (Synonym: UP)")
+    print("  D <val> [spd] : Move DOWN by <val> cm, optional speed 25-100% (Synonym: DOWN)")
+    print("  M <val> [spd] : Move TO <val> cm, optional speed 25-100% (Synonym: MOVE)")
+    print("  LIFT          : Smart Lift (Move UP to High Limit) (Synonym: RAISE)")
+    print("  LOWER         : Smart Lower (Move DOWN to Low Limit)")
+    print("  SH            : Set HIGH (Top) Soft Limit at current position")
+    print("  SL            : Set LOW (Bottom) Soft Limit at current position")
+    print("  CH            : Clear HIGH (Top) Soft Limit")
+    print("  CL            : Clear LOW (Bottom) Soft Limit")
+    print("  PAIR          : Scan and Pair a NEW winch")
+    print("  UNPAIR        : Remove a winch from configuration")
+    print("  P / S         : Print Status of all winches")
+    print("  Q             : Quit")
+    print("\nExamples:")
+    print("  1 U 10        -> Move Winch 1 UP by 10cm at 100% speed")
+    print("  1 U 10 50     -> Move Winch 1 UP by 10cm at 50% speed")
+    print("  ALL LIFT      -> Smart Lift ALL Winches")
+    print("  1,2 LIFT    -> Smart Lift Winches 1 and 2")
+    print("  PAIR        -> Start Pairing Mode")
+    print("--------------------\n")
+
+VALID_CMDS = frozenset({'LIFT', 'LOWER', 'SH', 'SL', 'CH', 'CL', 'CB', 'U', 'D', 'M'})
+MOVE_CMDS = frozenset({'U', 'D', 'M'})
+CMD_ALIASES = {'UP': 'U', 'DOWN': 'D', 'RAISE': 'LIFT', 'MOVE': 'M'}
+MONITORED_CMDS = frozenset({'LIFT', 'LOWER', 'U', 'D', 'M'})
+
+# Upper bounds on how long a dispatched command may run before every target is cancelled
+# (each monitor's finally still stops its winch). Deliberately loose: a stalled BLE link
+# should not hang the REPL, but a slow winch must never be cut off mid-move.
+MIN_SPEED_CM_S = 1.0        # Conservative travel rate at 100% speed
+MOVE_TIMEOUT_MARGIN_S = 10.0
+SMART_MOVE_TIMEOUT_S = 300.0
+COMMAND_TIMEOUT_S = 10.0    # Non-moving commands (SH/SL/CH/CL)
+
+def max_travel_seconds(delta_cm: float, speed: int = 100) -> float:
+    return abs(delta_cm) / (MIN_SPEED_CM_S * speed / 100) + MOVE_TIMEOUT_MARGIN_S
+
+# Target token: "1", "1,2", "1,2," (tokens come from str.split(), so no whitespace inside)
+_ID_RE = re.compile(r"\d+(?:,\d+)*,?")
+
+DEFAULT_TARGETS = (1,) # No ID given: command applies to winch 1
+
+def parse_targets(tok: str, all_ids):
+    """
+    Parses the leading target token of a command line.
+    Returns the target IDs (`all_ids` itself for ALL), or None if `tok` is not a target token (it's the command).
+    """
+    if tok.upper() == "ALL":
+        return all_ids
+    if _ID_RE.fullmatch(tok):
+        return [int(s) for s in tok.split(',') if s]
+    return None
+
+async def _set_point(c, i, point, label):
+    print(f"[Winch {i}] Setting {label} Limit...")
+    await c.set_smart_point(point)
 
-async def main():
+async def _clear_point(c, i, point, label):
+    print(f"[Winch {i}] Clearing {label} Limit...")
+    await c.clear_smart_point(point)
+
+# Per-target handlers for commands without arguments: (client, id, monitor) -> coroutine.
+# Distance moves (U/D/M) need per-target math and are handled inline.
+# Moves skip their own CLEAR_ERROR: the REPL broadcasts it to all targets first.
+DISPATCH = {
+    'LIFT':  lambda c, i, m: monitor_smart_move(c, MoveCode.SMART_UP, i, m, clear_first=False),
+    'LOWER': lambda c, i, m: monitor_smart_move(c, MoveCode.SMART_DOWN, i, m, clear_first=False),
+    'SH':    lambda c, i, m: _set_point(c, i, SmartPointCode.TOP, "High"),
+    'SL':    lambda c, i, m: _set_point(c, i, SmartPointCode.BOTTOM, "Low"),
+    'CH':    lambda c, i, m: _clear_point(c, i, SmartPointCode.TOP, "High"),
+    'CL':    lambda c, i, m: _clear_point(c, i, SmartPointCode.BOTTOM, "Low"),
+    'CB':    lambda c, i, m: _clear_point(c, i, SmartPointCode.BOTTOM, "Low"), # Synonym for CL
+}
+
+async def _run_bounded(coros, timeout: float) -> bool:
+    """Runs `coros` concurrently. On timeout all are cancelled (running their finally blocks); returns False."""
+    try:
+        await asyncio.wait_for(asyncio.gather(*coros), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+async def main(pair_first: bool = False, assume_compatible: bool = False):
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_file = os.path.join(script_dir, "pylifter_config.json")
     
@@ -489,8 +763,7 @@ async def main():
     
     # 1. Load Config
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
+        config = load_config(config_file)
     except FileNotFoundError:
         print("[Config] No config file found.")
         config = {"calibration": {}, "devices": []}
@@ -501,6 +774,10 @@ async def main():
     calibration = config.get("calibration", {})
     slope = calibration.get("slope", 1.0)
     intercept = calibration.get("intercept", 0.0)
+    # Distance -> position uses the inverse once per target instead of a division + zero check
+    inv_slope = 1.0 / slope if slope else None
+    if inv_slope is None:
+        print("[Config] Calibration slope is 0! Distance moves (U/D/M) are disabled.")
     
     # Check for legacy config format (migration fallback)
     if "mac_address" in config and "devices" not in config:
@@ -529,62 +806,96 @@ async def main():
         print("Connecting to all winches...")
         # Give adapter time to settle if we just started
         await asyncio.sleep(2.0)
-        for cid, client in clients.items():
-            print(f"[{cid}] Connecting to {client.mac_address}...", end='', flush=True)
-            connected = False
+
+        # Phase 1: connect all winches concurrently so the BLE handshakes interleave.
+        # Each one buffers its output; it's printed after the gathers in ID order.
+        async def connect_with_retry(cid, client):
+            out = f"[{cid}] Connecting to {client.mac_address}..."
             for attempt in range(3):
                 try:
                     await client.connect()
-                    print(" Connected.", end='', flush=True)
-                    connected = True
-                    
-                    # STABILITY FIX: Wait for BLE stack to settle before querying versions
-                    # High traffic immediately after connection can cause Service Discovery errors
-                    await asyncio.sleep(1.5)
-
-                    try:
-                        # Print Version
-                        ver = await client.get_version()
-                        proto_ver = await client.get_protocol_version()
-                        print(f" (Versions: Firmware={ver} | Protocol={proto_ver})")
-                        
-                        await check_firmware_support(ver)
-                    except Exception as ve:
-                        print(f"\n      [Warning] Could not verify firmware version: {ve}")
-                    
-                    break # Success, exit retry loop
-                    
+                    return out + " Connected.", True
                 except Exception as e:
                     if attempt < 2:
-                        print(f" Failed (Retry {attempt+1}/3): {e} ...", end='', flush=True)
-                        await asyncio.sleep(2.0)
+                        out += f" Failed (Retry {attempt+1}/3): {e} ..."
+                        # Short first retry for transient failures; jitter keeps concurrent winches from retrying in lockstep
+                        await asyncio.sleep(min(0.5 * 2 ** attempt, 4.0) + random.uniform(0, 0.25))
                     else:
-                        print(f" Failed: {e}")
+                        out += f" Failed: {e}"
+            return out + f"\n      [Error] Could not connect to winch {cid} after 3 attempts.", False
+
+        items = list(clients.items())
+        results = await asyncio.gather(*(connect_with_retry(cid, c) for cid, c in items), return_exceptions=True)
+        
+        outs = {}
+        connected = []
+        for (cid, client), res in zip(items, results):
+            if isinstance(res, Exception):
+                outs[cid] = f"[{cid}] {client.mac_address}: Failed: {res}"
+                continue
+            outs[cid], ok = res
+            if ok:
+                connected.append((cid, client))
+
+        vers = {}
+        if connected:
+            # No post-connect settle sleep: bleak's connect() already returns with services
+            # resolved, so the version queries can go out straight away.
             
-            if not connected:
-                print(f"      [Error] Could not connect to winch {cid} after 3 attempts.")
+            # Phase 2: every winch's version pair in flight at once (replies are keyed by command)
+            version_results = await asyncio.gather(
+                *(asyncio.gather(c.get_version(), c.get_protocol_version()) for _, c in connected),
+                return_exceptions=True)
+            for (cid, _), res in zip(connected, version_results):
+                if isinstance(res, Exception):
+                    outs[cid] += f"\n      [Warning] Could not verify firmware version: {res}"
+                else:
+                    ver, proto_ver = res
+                    vers[cid] = ver
+                    outs[cid] += f" (Versions: Firmware={ver} | Protocol={proto_ver})"
+
+        for cid, _ in items:
+            print(outs[cid])
+            if cid in vers:
+                # May prompt - run after all connects, one winch at a time
+                await check_firmware_support(vers[cid], assume_ok=assume_compatible)
         
     # Start Background Reconnect
     reconnect_task = asyncio.create_task(background_reconnect_loop(clients))
         
     def print_status():
-        print("\nStatus:")
+        # Build the whole block and emit it in one write
+        rows = ["\nStatus:"]
         if not clients:
-            print("  (No winches configured)")
+            rows.append("  (No winches configured)")
         for cid, c in clients.items():
-            status = "Connected" if c._is_connected else "Disconnected"
-            print(f"  [{cid:>2}] {c.mac_address} | {status:<10} | {c.current_distance:>5.1f} cm | Weight: {c.current_weight:>4} | Pos: {c._last_known_position}")
+            if c._is_connected:
+                rows.append(f"  [{cid:>2}] {c.mac_address} | Connected  | {c.current_distance:>5.1f} cm | Weight: {c.current_weight:>4} | Pos: {c._last_known_position}")
+            else:
+                rows.append(f"  [{cid:>2}] {c.mac_address} | Disconnected")
+        rows.append("")
+        sys.stdout.write("\n".join(rows))
+        sys.stdout.flush()
             
     print("\n--- Ready ---")
     
     skip_status = False
+    config_dirty = False
+    # IDs for ALL; only PAIR/UNPAIR change the client set, so rebuild it only there
+    all_ids = tuple(clients)
     while True:
+        # Persist pair/unpair changes once, off the event loop, before blocking on input
+        if config_dirty:
+            await asyncio.to_thread(save_config, config_file, config)
+            config_dirty = False
+            print("Saved to config.")
+
         # Print Status
         if not skip_status:
             print_status()
         skip_status = False # Reset for next loop
 
-        cmd_str = await asyncio.get_event_loop().run_in_executor(None, input, "\nCommand ([ID,ID | all] <CMD>... | PAIR | Q | ?): ")
+        cmd_str = await wait_for_input("\nCommand ([ID,ID | all] <CMD>... | PAIR | Q | ?): ")
         
         parts = cmd_str.strip().split()
         if not parts: continue
@@ -594,29 +905,11 @@ async def main():
         # e.g. "1,2", "1", "1, 3" is harder to split.
         # Logic: If first part starts with digit, assume it's IDs.
         
-        target_ids = []
-        cmd_start_idx = 0
-        
-        potential_ids = parts[0]
-        
-        if potential_ids.upper() == "ALL":
-             # Target ALL configured winches
-             target_ids = list(clients.keys())
-             cmd_start_idx = 1
-        elif potential_ids[0].isdigit():
-            # Parse IDs
-            try:
-                id_strs = potential_ids.split(',')
-                for s in id_strs:
-                    if s.strip():
-                        target_ids.append(int(s.strip()))
-                cmd_start_idx = 1
-            except ValueError:
-                # Not IDs, maybe command starts with digit? Unlikely.
-                pass
+        target_ids = parse_targets(parts[0], all_ids)
+        cmd_start_idx = 0 if target_ids is None else 1
         
         if not target_ids:
-            target_ids = [1] # Default to 1
+            target_ids = DEFAULT_TARGETS
         
         # Get actual command part
         if cmd_start_idx >= len(parts):
@@ -626,10 +919,7 @@ async def main():
         args = parts[cmd_start_idx+1:]
         
         # Normalize Synonyms
-        if cmd == "UP": cmd = "U"
-        if cmd == "DOWN": cmd = "D"
-        if cmd == "RAISE": cmd = "LIFT"
-        if cmd == "MOVE": cmd = "M"
+        cmd = CMD_ALIASES.get(cmd, cmd)
         
         if cmd == 'Q':
             break
@@ -639,65 +929,64 @@ async def main():
             continue
             
         if cmd == 'PAIR':
-            await pair_new_winch(config_file, config, clients)
+            config_dirty |= await pair_new_winch(config, clients, first_only=pair_first, assume_compatible=assume_compatible)
+            all_ids = tuple(clients)
             continue
             
         if cmd == 'UNPAIR':
-            await unpair_winch(config_file, config, clients)
+            config_dirty |= await unpair_winch(config, clients)
+            all_ids = tuple(clients)
             continue
             
-        def print_help():
-            print("\n--- Command Help ---")
-            print("Syntax: [ID,ID...|ALL] <COMMAND> [ARGS]")
-            print("  (If no ID is specified, Command applies to ID 1)")
-            print("\nAvailable Commands:")
-            print("  U <val> [spd] : Move UP by <val> cm, optional speed 25-100% (Synonym: UP)")
-            print("  D <val> [spd] : Move DOWN by <val> cm, optional speed 25-100% (Synonym: DOWN)")
-            print("  M <val> [spd] : Move TO <val> cm, optional speed 25-100% (Synonym: MOVE)")
-            print("  LIFT          : Smart Lift (Move UP to High Limit) (Synonym: RAISE)")
-            print("  LOWER         : Smart Lower (Move DOWN to Low Limit)")
-            print("  SH            : Set HIGH (Top) Soft Limit at current position")
-            print("  SL            : Set LOW (Bottom) Soft Limit at current position")
-            print("  CH            : Clear HIGH (Top) Soft Limit")
-            print("  CL            : Clear LOW (Bottom) Soft Limit")
-            print("  PAIR          : Scan and Pair a NEW winch")
-            print("  UNPAIR        : Remove a winch from configuration")
-            print("  UNPAIR        : Remove a winch from configuration")
-            print("  P / S         : Print Status of all winches")
-            print("  Q             : Quit")
-            print("\nExamples:")
-            print("  1 U 10        -> Move Winch 1 UP by 10cm at 100% speed")
-            print("  1 U 10 50     -> Move Winch 1 UP by 10cm at 50% speed")
-            print("  ALL LIFT      -> Smart Lift ALL Winches")
-            print("  1,2 LIFT    -> Smart Lift Winches 1 and 2")
-            print("  PAIR        -> Start Pairing Mode")
-            print("--------------------\n")
-
         if cmd == '?':
             print_help()
             continue
 
         # Validate Command
-        valid_cmds = ['LIFT', 'LOWER', 'SH', 'SL', 'CH', 'CL', 'CB', 'U', 'D', 'M']
-        if cmd not in valid_cmds:
+        if cmd not in VALID_CMDS:
             print(f"\n[ERROR] Unknown command: '{cmd}'")
             print_help()
             continue
             
         # Validate Args
-        if cmd in ['U', 'D', 'M'] and not args:
-             print(f"\n[ERROR] Command '{cmd}' requires a distance argument.")
-             print_help()
-             continue
+        if cmd in MOVE_CMDS:
+            if not args:
+                print(f"\n[ERROR] Command '{cmd}' requires a distance argument.")
+                print_help()
+                continue
+            # Distance and speed are the same for every target - parse them once
+            try:
+                val = float(args[0])
+            except ValueError:
+                print(f"Invalid Value: {args[0]}")
+                continue
+                
+            # Parse Speed (Optional)
+            speed = 100
+            if len(args) > 1:
+                try:
+                    speed = int(args[1])
+                except ValueError:
+                    print(f"Error: Invalid speed '{args[1]}'. Using 100.")
+                    print_help()
+                    continue
+                if not (25 <= speed <= 100):
+                    print(f"Error: Speed must be 25-100.")
+                    print_help()
+                    continue
 
         # Execute Command on Targets
         tasks = []
+        handler = DISPATCH.get(cmd)
+        cmd_timeout = SMART_MOVE_TIMEOUT_S if cmd in ('LIFT', 'LOWER') else COMMAND_TIMEOUT_S
         
         # Setup Monitor for Movement Commands
         monitor = None
-        if cmd in ['LIFT', 'LOWER', 'U', 'D', 'M']:
+        if cmd in MONITORED_CMDS:
+            # One concurrent CLEAR_ERROR round for every target, instead of one inside each move
+            await asyncio.gather(*(clients[t].clear_error_and_wait() for t in target_ids
+                                   if t in clients and clients[t]._is_connected))
             monitor = LiveStatusMonitor(clients, target_ids)
-            tasks.append(monitor.run())
         
         for tid in target_ids:
             if tid not in clients:
@@ -714,107 +1003,51 @@ async def main():
                 continue
             
             # Dispatch Command
-            if cmd == 'LIFT':
-                tasks.append(monitor_smart_move(client, MoveCode.SMART_UP, tid, monitor))
-            elif cmd == 'LOWER':
-                tasks.append(monitor_smart_move(client, MoveCode.SMART_DOWN, tid, monitor))
-            elif cmd == 'SH':
-                 async def do_sh(c, i):
-                     print(f"[Winch {i}] Setting High Limit...")
-                     await c.set_smart_point(SmartPointCode.TOP)
-                 tasks.append(do_sh(client, tid))
-            elif cmd == 'SL':
-                 async def do_sl(c, i):
-                     print(f"[Winch {i}] Setting Low Limit...")
-                     await c.set_smart_point(SmartPointCode.BOTTOM)
-                 tasks.append(do_sl(client, tid))
-            elif cmd == 'CH':
-                 async def do_ch(c, i):
-                     print(f"[Winch {i}] Clearing High Limit...")
-                     await c.clear_smart_point(SmartPointCode.TOP)
-                 tasks.append(do_ch(client, tid))
-            elif cmd in ['CL', 'CB']: # Support CL or CB
-                 async def do_cl(c, i):
-                     print(f"[Winch {i}] Clearing Low Limit...")
-                     await c.clear_smart_point(SmartPointCode.BOTTOM)
-                 tasks.append(do_cl(client, tid))
-                 tasks.append(do_cl(client, tid))
-            elif cmd in ['U', 'D', 'M']:
-                try:
-                    val = float(args[0])
-                    
-                    # Parse Speed (Optional)
-                    speed = 100
-                    if len(args) > 1:
-                        try:
-                            speed = int(args[1])
-                            if not (25 <= speed <= 100):
-                                print(f"Error: Speed must be 25-100.")
-                                print_help()
-                                continue
-                        except ValueError:
-                            print(f"Error: Invalid speed '{args[1]}'. Using 100.")
-                            print_help()
-                            continue
-
-                    current_dist = client.current_distance
-                    
-                    target_dist = 0.0
-                    direction = MoveCode.UP # Default
-                    
-                    if cmd == 'U':
-                        target_dist = current_dist - val
+            if handler is not None:
+                tasks.append(handler(client, tid, monitor))
+            elif cmd in MOVE_CMDS:
+                current_dist = client.current_distance
+                
+                target_dist = 0.0
+                direction = MoveCode.UP # Default
+                
+                if cmd == 'U':
+                    target_dist = current_dist - val
+                    direction = MoveCode.UP
+                elif cmd == 'D':
+                    target_dist = current_dist + val
+                    direction = MoveCode.DOWN
+                elif cmd == 'M':
+                    target_dist = val
+                    if target_dist < current_dist:
                         direction = MoveCode.UP
-                    elif cmd == 'D':
-                        target_dist = current_dist + val
+                    else:
                         direction = MoveCode.DOWN
-                    elif cmd == 'M':
-                        target_dist = val
-                        if target_dist < current_dist:
-                            direction = MoveCode.UP
-                        else:
-                            direction = MoveCode.DOWN
-                        
-                    if slope == 0:
-                        print(f"[Winch {tid}] Cal slope is 0!")
-                        continue
-                        
-                    target_pos = int((target_dist - intercept) / slope)
                     
-                    # Note: We disabled interactive override for batch moves with monitor
-                    # The monitor doesn't support input() easily regardless of batch size
-                    tasks.append(monitor_move(client, target_pos, direction, tid, speed=speed, monitor=monitor))
-                except ValueError:
-                    print(f"Invalid Value: {args[0]}")
+                if inv_slope is None:
+                    print(f"[Winch {tid}] Cal slope is 0!")
+                    continue
+                    
+                target_pos = int((target_dist - intercept) * inv_slope)
+                cmd_timeout = max(cmd_timeout, max_travel_seconds(target_dist - current_dist, speed))
+                
+                # Note: We disabled interactive override for batch moves with monitor
+                # The monitor doesn't support input() easily regardless of batch size
+                tasks.append(monitor_move(client, target_pos, direction, tid, speed=speed, monitor=monitor, clear_first=False))
             else:
                 pass
                 
-        if tasks:
-            if monitor:
-                # Run everything, monitor is one of the tasks
-                # But we need to ensure monitor.stop() is called when move tasks finish
-                # gather() will run monitor forever (it loops while active) which will block?
-                # No, monitor.run() loops while self.active.
-                # So we need to await the MOVEMENT tasks, then stop monitor.
-                
-                # Separate monitor task from work tasks
-                monitor_task = tasks.pop(0) # The first one we added
-                worker_tasks = tasks
-                
-                # Start Monitor
-                m_task = asyncio.create_task(monitor_task)
-                
-                # Run Workers
-                await asyncio.gather(*worker_tasks)
-                
-                # Stop Monitor
-                monitor.stop()
-                await m_task
-                
-                # Prevent re-printing status since monitor just showed the final state
-                skip_status = True
-            else:
-                await asyncio.gather(*tasks)
+        if monitor:
+            # The monitor draws while the workers run and is stopped when they finish (or raise)
+            async with monitor:
+                timed_out = not await _run_bounded(tasks, cmd_timeout)
+            if timed_out:
+                print(f"[ERROR] Command timed out after {cmd_timeout:.0f}s. Targets stopped.")
+            
+            # Prevent re-printing status since monitor just showed the final state
+            skip_status = True
+        elif tasks and not await _run_bounded(tasks, cmd_timeout):
+            print(f"[ERROR] Command timed out after {cmd_timeout:.0f}s.")
 
     # Cancel Reconnect Task
     if reconnect_task:
@@ -830,12 +1063,8 @@ async def main():
     all_ids = list(clients.keys())
     if all_ids:
         disc_monitor = LiveStatusMonitor(clients, all_ids)
-        # Pre-set statuses to avoid "Waiting..." flash if possible or just let it be waiting
         
-        # We run the monitor in background while we process disconnects
-        mon_task = asyncio.create_task(disc_monitor.run())
-        
-        for cid in all_ids:
+        async def disconnect_one(cid):
             c = clients[cid]
             if c._is_connected:
                 disc_monitor.update_status(cid, "Disconnecting...")
@@ -843,18 +1072,22 @@ async def main():
                 disc_monitor.update_status(cid, "Disconnected")
             else:
                  disc_monitor.update_status(cid, "Already Disconnected")
-                 
-        disc_monitor.stop()
-        await mon_task
+
+        # We run the monitor in background while we process disconnects
+        async with disc_monitor:
+            await asyncio.gather(*(disconnect_one(cid) for cid in all_ids), return_exceptions=True)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="PyLifter Interactive Demo")
     parser.add_argument("--debug", action="store_true", help="Enable verbose logging to debug.log")
+    parser.add_argument("--first", action="store_true", help="PAIR: stop scanning at the first MyLifter found")
+    parser.add_argument("--assume-compatible", action="store_true", default=os.environ.get("PYLIFTER_YES") == "1",
+                        help="Warn about untested firmware instead of prompting (also PYLIFTER_YES=1)")
     args = parser.parse_args()
     
     configure_logging(enable_debug_file=args.debug)
     
     try:
-        asyncio.run(main())
+        asyncio.run(main(pair_first=args.first, assume_compatible=args.assume_compatible))
     except KeyboardInterrupt:
         pass # Clean exit on Ctrl+C